@@ -24,3 +24,26 @@ class Agent:
             action  (int or tuple)
         """
         raise NotImplementedError("choose_action() must be implemented by subclasses.")
+
+    def solve(self, state, max_moves=50):
+        """
+        Drive choose_action() from state until the goal is reached.
+        Plan-based agents search once from state and then follow their plan
+        for as long as the state is the one the plan predicts.
+
+        Returns:
+            list of actions, or None if the agent gives up or runs out of moves
+        """
+        plan = []
+        for _ in range(max_moves):
+            if self.model.is_terminal(state):
+                return plan
+
+            action = self.choose_action(state)
+            if action is None:
+                return None
+
+            plan.append(action)
+            state = self.model.transition(state, action)
+
+        return plan if self.model.is_terminal(state) else None
@@ -0,0 +1,123 @@
+from agent.agent import Agent
+import heapq
+
+from model.model import canonical
+
+# Expansions between should_stop() checks in _astar_plan
+STOP_CHECK_INTERVAL = 1024
+
+
+class WeightedAStarAgent(Agent):
+    def __init__(self, model, weight=2.0, max_nodes=100_000):
+        """
+        Weighted A*: expands by g + weight * h, h = model.distance_map() at the
+        target robot. h is consistent, so even without reopening closed states
+        a plan is at most `weight` times longer than optimal; weight=1 is
+        optimal A*.
+
+        weight    : >= 1, trades plan length for fewer expansions
+        max_nodes : expansions before giving up
+        """
+        super().__init__(model)
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+        self.weight = weight
+        self.max_nodes = max_nodes
+        self.stats = {}
+        self.plan = None
+        self.plan_index = 0
+        self.expected_state = None
+
+    def choose_action(self, state):
+        # Replan unless we are where the previous plan said we would be
+        if self.plan is None or state != self.expected_state:
+            self.plan = self._cached_plan(state)
+            self.plan_index = 0
+
+        if self.plan is None or self.plan_index >= len(self.plan):
+            return None
+
+        action = self.plan[self.plan_index]
+        self.plan_index += 1
+        self.expected_state = self.model.transition(state, action)
+        return action
+
+    def _cached_plan(self, state):
+        cache = self.model.cache
+        if cache is not None:
+            hit = cache.lookup(self.model, state)
+            if hit is not None and hit[1]:
+                return hit[0]
+
+        plan = self._astar_plan(state)
+        if cache is not None and plan is not None:
+            cache.store(self.model, state, plan, optimal=self.weight == 1)
+        return plan
+
+    def _astar_plan(self, start_state, should_stop=None):
+        """
+        should_stop : optional callable polled every STOP_CHECK_INTERVAL
+                      expansions; the search returns None once it is true
+        """
+        model = self.model
+        dist = model.distance_map()
+        cols = model.cols
+        unreachable = model.rows * cols
+        weight = self.weight
+
+        start_key = canonical(start_state)
+        h0 = dist[start_state[0][0] * cols + start_state[0][1]]
+        # key -> [g, actual state, parent key, action]
+        nodes = {start_key: [0, start_state, None, None]}
+        closed = set()
+        heap = [(weight * h0, h0, 0, start_key)]
+        counter = 1
+        expanded = generated = 0
+
+        while heap:
+            _, _, _, key = heapq.heappop(heap)
+            if key in closed:
+                continue
+            closed.add(key)
+
+            g, state, _, _ = nodes[key]
+            if model.is_terminal(state):
+                self.stats = {"expanded": expanded, "generated": generated, "weight": weight}
+                return self._reconstruct(nodes, key)
+
+            expanded += 1
+            if expanded > self.max_nodes:
+                break
+            if should_stop is not None and expanded % STOP_CHECK_INTERVAL == 0 and should_stop():
+                break
+
+            for next_state, action in model.successors(state):
+                next_key = canonical(next_state)
+                if next_key in closed:
+                    continue
+                node = nodes.get(next_key)
+                if node is not None and node[0] <= g + 1:
+                    continue
+
+                r, c = next_state[0]
+                h = dist[r * cols + c]
+                if h >= unreachable:
+                    continue
+                nodes[next_key] = [g + 1, next_state, key, action]
+                heapq.heappush(heap, (g + 1 + weight * h, h, counter, next_key))
+                counter += 1
+                generated += 1
+
+        self.stats = {"expanded": expanded, "generated": generated, "weight": weight}
+        return None
+
+    def _reconstruct(self, nodes, key):
+        plan = []
+        while True:
+            _, _, parent, action = nodes[key]
+            if parent is None:
+                break
+            plan.append(action)
+            key = parent
+        plan.reverse()
+        return plan
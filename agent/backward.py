@@ -0,0 +1,171 @@
+"""
+Optimal plans for many start states on one (board, goal) from a shared search.
+
+solve_many() runs a backward BFS from every goal state using
+RRModel.predecessors(), labelling each state with its distance and first
+move, and stops as soon as every start is labelled. If the backward search
+hits its node budget first (goal states alone number C(cells-1, robots-1),
+so this happens early with 4 robots), the remaining starts are finished by a
+forward BFS that meets the labelled region: once levels 0..D are complete,
+an unlabelled state is more than D moves from the goal, which bounds when the
+forward search can stop with an optimal plan.
+"""
+
+import itertools
+import math
+
+from model.model import canonical
+
+# Default backward budget: the search must pay for itself across the starts
+NODES_PER_START = 2_000
+
+
+def solve_many(model, starts, max_nodes=None, max_forward_nodes=1_000_000, stats=None):
+    """
+    Return an optimal plan (list of actions) for each start state, or None
+    for starts that could not be solved within the budgets.
+
+    max_nodes         : states labelled by the backward search
+                        (default: NODES_PER_START per start)
+    max_forward_nodes : states expanded per start by the forward fallback
+    stats             : optional dict, filled with labelled / depth / forward counts
+
+    Plans are stored in model.cache as optimal when a cache is attached.
+    """
+    starts = list(starts)
+    if not starts:
+        return []
+
+    if max_nodes is None:
+        max_nodes = NODES_PER_START * len(starts)
+    labels, depth = _backward_labels(model, starts, max_nodes)
+    plans = []
+    forward = 0
+    for start in starts:
+        if canonical(start) in labels or model.is_terminal(start):
+            plan = _follow(model, start, labels)
+        else:
+            plan = _meet(model, start, labels, depth, max_forward_nodes)
+            forward += 1
+        plans.append(plan)
+
+        if model.cache is not None and plan is not None:
+            model.cache.store(model, start, plan, optimal=True)
+
+    if stats is not None:
+        stats.update(labelled=len(labels), depth=depth, forward_searches=forward)
+    return plans
+
+
+def _backward_labels(model, starts, max_nodes):
+    """
+    Returns (labels, depth): labels maps canonical non-goal states to
+    (distance, (moving robot's cell, direction)); every state within `depth`
+    moves of the goal is labelled.
+    """
+    num_robots = len(starts[0])
+    num_cells = model.rows * model.cols
+    labels = {}
+    if math.comb(num_cells - 1, num_robots - 1) > max_nodes:
+        return labels, 0
+
+    goal = model.goal
+    cells = [(r, c) for r in range(model.rows) for c in range(model.cols) if (r, c) != goal]
+    frontier = [(goal,) + blockers for blockers in itertools.combinations(cells, num_robots - 1)]
+    pending = {canonical(s) for s in starts if not model.is_terminal(s)}
+    size = len(frontier)
+    depth = 0
+
+    while frontier and pending:
+        next_frontier = []
+        for state in frontier:
+            for prev_state, (robot, direction) in model.predecessors(state):
+                if model.is_terminal(prev_state):
+                    continue
+                key = canonical(prev_state)
+                if key in labels:
+                    continue
+                labels[key] = (depth + 1, (prev_state[robot], direction))
+                next_frontier.append(key)
+                pending.discard(key)
+
+            if not pending:
+                return labels, depth
+            if size + len(next_frontier) > max_nodes:
+                # Level depth + 1 is incomplete; only its labels are usable
+                return labels, depth
+
+        size += len(next_frontier)
+        frontier = next_frontier
+        depth += 1
+
+    return labels, depth
+
+
+def _follow(model, state, labels):
+    """Replay first moves from a labelled state down to the goal."""
+    plan = []
+    while not model.is_terminal(state):
+        _, (cell, direction) = labels[canonical(state)]
+        action = (state.index(cell), direction)
+        plan.append(action)
+        state = model.transition(state, action)
+    return plan
+
+
+def _meet(model, start, labels, depth, max_nodes):
+    """
+    Forward BFS from start until it provably found the shortest route into the
+    labelled region: after forward level f, any unlabelled route costs at
+    least f + depth + 1.
+    """
+    start_key = canonical(start)
+    parents = {start_key: None}
+    frontier = [start]
+    best = None
+    f = 0
+    expanded = 0
+
+    while frontier:
+        for state in frontier:
+            key = canonical(state)
+            label = labels.get(key)
+            dist = 0 if model.is_terminal(state) else label[0] if label else None
+            if dist is not None and (best is None or f + dist < best[0]):
+                best = (f + dist, state)
+
+        if best is not None and best[0] <= f + depth + 1:
+            break
+
+        next_frontier = []
+        for state in frontier:
+            expanded += 1
+            if expanded > max_nodes:
+                return None
+            key = canonical(state)
+            for next_state, (robot, direction) in model.successors(state):
+                next_key = canonical(next_state)
+                if next_key not in parents:
+                    parents[next_key] = (key, state[robot], direction)
+                    next_frontier.append(next_state)
+        frontier = next_frontier
+        f += 1
+
+    if best is None:
+        return None
+
+    _, state = best
+    moves = []
+    key = canonical(state)
+    while parents[key] is not None:
+        key, cell, direction = parents[key]
+        moves.append((cell, direction))
+    moves.reverse()
+
+    plan = []
+    state = start
+    for cell, direction in moves:
+        action = (state.index(cell), direction)
+        plan.append(action)
+        state = model.transition(state, action)
+    return plan + _follow(model, state, labels)
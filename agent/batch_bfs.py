@@ -0,0 +1,182 @@
+from agent.agent import Agent
+import numpy as np
+
+from model.model import UP, RIGHT, DOWN, LEFT
+
+
+class BatchBFSAgent(Agent):
+    def __init__(self, model, max_nodes=10_000_000):
+        """
+        BFS that expands a whole frontier level at once with NumPy.
+
+        States are packed into int64 (model.pack_state layout). Each level
+        computes every (robot, direction) slide for all frontier states from a
+        wall-only stop table, clips it at the nearest robot on the same line,
+        and dedupes the children with np.unique against a sorted visited array.
+        """
+        super().__init__(model)
+        self.max_nodes = max_nodes
+        self.plan = None
+        self.plan_index = 0
+        self.expected_state = None
+        self.stats = {}
+        self._stops = None
+        self._stops_key = None
+
+    def choose_action(self, state):
+        # Replan unless we are where the previous plan said we would be
+        if self.plan is None or state != self.expected_state:
+            self.plan = self._cached_plan(state)
+            self.plan_index = 0
+
+        if self.plan is None or self.plan_index >= len(self.plan):
+            return None
+
+        action = self.plan[self.plan_index]
+        self.plan_index += 1
+        self.expected_state = self.model.transition(state, action)
+        return action
+
+    def _cached_plan(self, state):
+        cache = self.model.cache
+        if cache is not None:
+            hit = cache.lookup(self.model, state)
+            if hit is not None and hit[1]:
+                return hit[0]
+
+        plan = self._batch_bfs_plan(state)
+        if cache is not None and plan is not None:
+            cache.store(self.model, state, plan, optimal=True)
+        return plan
+
+    def _stop_table(self):
+        """stops[d][cell] = where a lone robot on cell stops sliding in direction d."""
+        model = self.model
+        if self._stops is None or self._stops_key != model.board_key():
+            stops = np.empty((4, model.rows * model.cols), dtype=np.int64)
+            for d in (UP, RIGHT, DOWN, LEFT):
+                stops[d] = [r * model.cols + c for r, c in model._stops[d]]
+            self._stops = stops
+            self._stops_key = model.board_key()
+        return self._stops
+
+    def _batch_bfs_plan(self, start_state):
+        model = self.model
+        num_robots = len(start_state)
+        bits = model.cell_bits
+        if bits * num_robots > 63:
+            raise ValueError(
+                f"{num_robots} robots x {bits} bits per cell does not fit an int64 state")
+
+        cols = model.cols
+        mask = (1 << bits) - 1
+        goal_cell = model.goal[0] * cols + model.goal[1]
+        shifts = np.arange(num_robots, dtype=np.int64) * bits
+        stops = self._stop_table()
+
+        frontier = np.array([model.pack_state(start_state)], dtype=np.int64)
+        cells = (frontier[:, None] >> shifts) & mask
+        visited = self._canonical(cells, shifts)
+        level_parents = []
+        level_moves = []
+        self.stats = {"levels": 0, "states": 1}
+
+        while frontier.size:
+            hits = np.flatnonzero((frontier & mask) == goal_cell)
+            if hits.size:
+                return self._reconstruct(level_parents, level_moves, int(hits[0]))
+
+            children, parents, moves, child_cells = self._expand(frontier, stops, shifts, mask, cols)
+            if children.size == 0:
+                return None
+
+            keys, first = np.unique(self._canonical(child_cells, shifts), return_index=True)
+            pos = np.searchsorted(visited, keys)
+            seen = np.zeros(keys.size, dtype=bool)
+            inside = pos < visited.size
+            seen[inside] = visited[pos[inside]] == keys[inside]
+
+            fresh = first[~seen]
+            visited = np.union1d(visited, keys[~seen])
+            frontier = children[fresh]
+            level_parents.append(parents[fresh])
+            level_moves.append(moves[fresh])
+
+            self.stats["levels"] += 1
+            self.stats["states"] = int(visited.size)
+            if visited.size > self.max_nodes:
+                return None
+
+        return None
+
+    def _expand(self, frontier, stops, shifts, mask, cols):
+        cells = (frontier[:, None] >> shifts) & mask
+        rows_of = cells // cols
+        cols_of = cells % cols
+        num_robots = cells.shape[1]
+        parent_index = np.arange(frontier.size)
+
+        out_children, out_parents, out_moves, out_cells = [], [], [], []
+
+        for i in range(num_robots):
+            pos = cells[:, i]
+            others = [j for j in range(num_robots) if j != i]
+
+            for d in (UP, RIGHT, DOWN, LEFT):
+                stop = stops[d][pos]
+
+                # Work in a signed coordinate along the slide so that "further
+                # along" is always larger, then clip at the nearest robot.
+                if d in (LEFT, RIGHT):
+                    sign = 1 if d == RIGHT else -1
+                    line, along = rows_of, cols_of
+                else:
+                    sign = 1 if d == DOWN else -1
+                    line, along = cols_of, rows_of
+
+                a_pos = sign * along[:, i]
+                a_new = sign * (stop // cols if d in (UP, DOWN) else stop % cols)
+                for j in others:
+                    a_j = sign * along[:, j]
+                    blocks = (line[:, j] == line[:, i]) & (a_j > a_pos) & (a_j <= a_new)
+                    a_new = np.where(blocks, a_j - 1, a_new)
+
+                if d in (LEFT, RIGHT):
+                    new = rows_of[:, i] * cols + sign * a_new
+                else:
+                    new = sign * a_new * cols + cols_of[:, i]
+
+                moved = new != pos
+                if not moved.any():
+                    continue
+
+                child_cells = cells[moved].copy()
+                child_cells[:, i] = new[moved]
+                shift = shifts[i]
+                out_children.append(
+                    frontier[moved] - (pos[moved] << shift) + (new[moved] << shift))
+                out_parents.append(parent_index[moved])
+                out_moves.append(np.full(int(moved.sum()), i * 4 + d, dtype=np.int16))
+                out_cells.append(child_cells)
+
+        if not out_children:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty.astype(np.int16), np.empty((0, num_robots), dtype=np.int64)
+
+        return (np.concatenate(out_children), np.concatenate(out_parents),
+                np.concatenate(out_moves), np.concatenate(out_cells))
+
+    def _canonical(self, cells, shifts):
+        """Packed key with blocker cells sorted (blocker symmetry)."""
+        canon = cells.copy()
+        if canon.shape[1] > 2:
+            canon[:, 1:] = np.sort(canon[:, 1:], axis=1)
+        return (canon << shifts).sum(axis=1)
+
+    def _reconstruct(self, level_parents, level_moves, i):
+        plan = []
+        for parents, moves in zip(reversed(level_parents), reversed(level_moves)):
+            plan.append(divmod(int(moves[i]), 4))
+            i = int(parents[i])
+        plan.reverse()
+        return plan
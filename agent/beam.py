@@ -0,0 +1,109 @@
+from agent.agent import Agent
+from model.model import canonical
+
+
+class BeamSearchAgent(Agent):
+    def __init__(self, model, beam_width=500, max_nodes=200_000, max_depth=50):
+        """
+        Breadth-first beam search: each level keeps the beam_width successors
+        closest to the goal by model.distance_map(). No optimality guarantee.
+
+        beam_width : states kept per level
+        max_nodes  : memory cap on remembered states; past it, duplicate
+                     detection forgets all but the last two levels
+        max_depth  : levels before giving up
+        """
+        super().__init__(model)
+        self.beam_width = beam_width
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.stats = {}
+        self.plan = None
+        self.plan_index = 0
+        self.expected_state = None
+
+    def choose_action(self, state):
+        if self.plan is None or state != self.expected_state:
+            self.plan = self._cached_plan(state)
+            self.plan_index = 0
+
+        if self.plan is None or self.plan_index >= len(self.plan):
+            return None
+
+        action = self.plan[self.plan_index]
+        self.plan_index += 1
+        self.expected_state = self.model.transition(state, action)
+        return action
+
+    def _cached_plan(self, state):
+        cache = self.model.cache
+        if cache is not None:
+            hit = cache.lookup(self.model, state)
+            if hit is not None and hit[1]:
+                return hit[0]
+
+        plan = self._beam_plan(state)
+        if cache is not None and plan is not None:
+            cache.store(self.model, state, plan, optimal=False)
+        return plan
+
+    def _beam_plan(self, start_state):
+        model = self.model
+        dist = model.distance_map()
+        cols = model.cols
+        unreachable = model.rows * cols
+
+        if model.is_terminal(start_state):
+            return []
+
+        # levels[d] = [(state, index of parent in levels[d-1], action)]
+        levels = [[(start_state, None, None)]]
+        seen = {canonical(start_state)}
+        previous = set()
+        generated = forgotten = 0
+
+        for depth in range(1, self.max_depth + 1):
+            candidates = []
+            for parent, (state, _, _) in enumerate(levels[-1]):
+                for next_state, action in model.successors(state):
+                    if model.is_terminal(next_state):
+                        levels.append([(next_state, parent, action)])
+                        self.stats = {"depth": depth, "generated": generated + 1,
+                                      "remembered": len(seen), "forgotten": forgotten}
+                        return self._reconstruct(levels)
+
+                    key = canonical(next_state)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    generated += 1
+
+                    r, c = next_state[0]
+                    h = dist[r * cols + c]
+                    if h < unreachable:
+                        candidates.append((h, len(candidates), next_state, parent, action))
+
+            if not candidates:
+                break
+            candidates.sort()
+            levels.append([(s, p, a) for _, _, s, p, a in candidates[:self.beam_width]])
+
+            current = {canonical(s) for s, _, _ in levels[-1]}
+            if len(seen) > self.max_nodes:
+                kept = previous | current
+                forgotten += len(seen) - len(kept)
+                seen = kept
+            previous = current
+
+        self.stats = {"depth": len(levels) - 1, "generated": generated,
+                      "remembered": len(seen), "forgotten": forgotten}
+        return None
+
+    def _reconstruct(self, levels):
+        plan = []
+        index = 0
+        for level in reversed(levels[1:]):
+            _, index, action = level[index]
+            plan.append(action)
+        plan.reverse()
+        return plan
@@ -1,29 +1,95 @@
 from agent.agent import Agent
+from array import array
 from collections import deque
 
+from agent.astar import WeightedAStarAgent
+from agent.pruning import RelevancePruner
+from model.visited import BitsetVisited, StateIndex
+
+STORAGES = ("set", "bitset", "external")
+
 class BFSAgent(Agent):
-    def __init__(self, model, max_nodes=100_000):
+    def __init__(self, model, max_nodes=100_000, storage="set", max_bitset_bytes=1 << 30,
+                 scratch_dir=None, buffer_size=1_000_000, prune=False):
+        """
+        storage : "set"      - Python set of tuple states, path copied per node
+                  "bitset"   - bitset over ranked states (blocker symmetry) plus
+                               flat arrays of packed states, parent indices and
+                               moves; scales to millions of states
+                  "external" - sorted per-level frontier files in scratch_dir,
+                               at most buffer_size records held in RAM
+        prune   : skip irrelevant blocker moves (agent.pruning), bounded by a
+                  weighted A* plan length; set/bitset storage only
+        """
         super().__init__(model)
+        if storage not in STORAGES:
+            raise ValueError(f"storage must be one of {STORAGES}")
+        if prune and storage == "external":
+            raise ValueError("prune is not supported with external storage")
         self.max_nodes = max_nodes
+        self.storage = storage
+        self.max_bitset_bytes = max_bitset_bytes
+        self.scratch_dir = scratch_dir
+        self.buffer_size = buffer_size
+        self.prune = prune
+        self.stats = {}
         self.plan = None
         self.plan_index = 0
-        self.last_start_state = None
+        self.expected_state = None
 
     def choose_action(self, state):
-        # If no plan exists or state changed unexpectedly, replan
-        if self.plan is None or state != self.last_start_state:
-            self.plan = self._bfs_plan(state)
+        # Replan unless we are where the previous plan said we would be
+        if self.plan is None or state != self.expected_state:
+            self.plan = self._cached_plan(state)
             self.plan_index = 0
-            self.last_start_state = state
 
         if self.plan is None or self.plan_index >= len(self.plan):
             return None
 
         action = self.plan[self.plan_index]
         self.plan_index += 1
+        self.expected_state = self.model.transition(state, action)
         return action
 
-    def _bfs_plan(self, start_state):
+    def _cached_plan(self, state):
+        cache = self.model.cache
+        if cache is not None:
+            hit = cache.lookup(self.model, state)
+            if hit is not None and hit[1]:
+                return hit[0]
+
+        pruner = bound = None
+        if self.prune:
+            pruner, bound = self._pruning_bound(state)
+
+        if self.storage == "bitset":
+            plan = self._bfs_plan_bitset(state, pruner, bound)
+        elif self.storage == "external":
+            # Imported here: its file handling is dead weight for in-memory runs
+            from agent.external_bfs import external_bfs_plan
+            plan, self.stats = external_bfs_plan(
+                self.model, state, self.scratch_dir, self.buffer_size, self.max_nodes)
+        else:
+            plan = self._bfs_plan(state, pruner, bound)
+        if pruner is not None:
+            self.stats = dict(pruner.stats(), bound=bound)
+        if cache is not None and plan is not None:
+            cache.store(self.model, state, plan, optimal=True)
+        return plan
+
+    def _pruning_bound(self, state):
+        """A pruner plus an upper bound on the plan length, or (None, None) if none is found."""
+        plan = WeightedAStarAgent(self.model, weight=2.0, max_nodes=self.max_nodes)._astar_plan(state)
+        if plan is None:
+            return None, None
+        return RelevancePruner(self.model), len(plan)
+
+    def _successors(self, state, depth, pruner, bound):
+        if pruner is None:
+            return self.model.successors(state)
+        return pruner.successors(state, bound - depth)
+
+    def _bfs_plan(self, start_state, pruner=None, bound=None):
         queue = deque()
         queue.append((start_state, []))
         visited = {start_state}
@@ -39,9 +105,58 @@ class BFSAgent(Agent):
             if self.model.is_terminal(state):
                 return path
 
-            for next_state, action in self.model.successors(state):
+            for next_state, action in self._successors(state, len(path), pruner, bound):
                 if next_state not in visited:
                     visited.add(next_state)
                     queue.append((next_state, path + [action]))
 
         return None
+
+    def _bfs_plan_bitset(self, start_state, pruner=None, bound=None):
+        model = self.model
+        num_robots = len(start_state)
+        cols = model.cols
+        if model.cell_bits * num_robots > 64:
+            # Such state spaces are far beyond any bitset anyway
+            raise ValueError(
+                f"{num_robots} robots x {model.cell_bits} bits per cell does not fit "
+                "bitset storage's 64-bit packed states; use storage='set'")
+        index = StateIndex(model.rows * cols, num_robots)
+        visited = BitsetVisited(index.size, self.max_bitset_bytes)
+
+        # The queue is never popped: states[i] stays addressable so that
+        # parents[i] / moves[i] can rebuild the plan once the goal is found.
+        states = array("Q", [model.pack_state(start_state)])
+        parents = array("L", [0])
+        moves = array("H", [0])
+        visited.add(index.rank([r * cols + c for r, c in start_state]))
+
+        head = 0
+        depth, level_end = 0, 1
+        while head < len(states):
+            if head >= self.max_nodes:
+                return None
+            if head == level_end:
+                depth, level_end = depth + 1, len(states)
+
+            state = model.unpack_state(states[head], num_robots)
+            if model.is_terminal(state):
+                return self._reconstruct(parents, moves, head)
+
+            for next_state, (robot, direction) in self._successors(state, depth, pruner, bound):
+                if visited.add(index.rank([r * cols + c for r, c in next_state])):
+                    states.append(model.pack_state(next_state))
+                    parents.append(head)
+                    moves.append(robot * 4 + direction)
+
+            head += 1
+
+        return None
+
+    def _reconstruct(self, parents, moves, i):
+        plan = []
+        while i != 0:
+            plan.append(divmod(moves[i], 4))
+            i = parents[i]
+        plan.reverse()
+        return plan
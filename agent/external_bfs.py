@@ -0,0 +1,235 @@
+"""
+Disk-backed BFS frontiers for BFSAgent(storage="external").
+
+Each level is a file of fixed-size records sorted by canonical state key:
+    (key, packed state, packed parent state, robot * 4 + direction)
+
+Successors of a level are buffered in RAM up to `buffer_size` records, sorted
+and written as runs; the runs are then merged, deduplicated and filtered
+against a sorted file of every key seen so far in one streaming pass to form
+the next level. Moves are not reversible, so a state from any earlier level
+can reappear; checking all of them means each state is expanded once and an
+exhausted search ends when a level comes out empty. The visited file is then
+merged with the new level's keys, so each level rewrites it once.
+"""
+
+import heapq
+import os
+import shutil
+import struct
+import tempfile
+import time
+
+from model.model import canonical_key
+
+RECORD = struct.Struct("<QQQH")
+KEY = struct.Struct("<Q")
+CHUNK = 4096
+
+
+class _Clock:
+    def __init__(self):
+        self.io = 0.0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+
+def _read_records(path, clock, record=RECORD):
+    with open(path, "rb") as f:
+        while True:
+            t0 = time.perf_counter()
+            buf = f.read(record.size * CHUNK)
+            clock.io += time.perf_counter() - t0
+            if not buf:
+                return
+            clock.bytes_read += len(buf)
+            yield from record.iter_unpack(buf)
+
+
+def _write_records(path, records, clock, record=RECORD):
+    """Write an iterable of records in chunks; returns the record count."""
+    count = 0
+    with open(path, "wb") as f:
+        chunk = []
+        for rec in records:
+            chunk.append(record.pack(*rec))
+            if len(chunk) == CHUNK:
+                count += _flush(f, chunk, clock)
+                chunk = []
+        if chunk:
+            count += _flush(f, chunk, clock)
+    return count
+
+
+def _flush(f, chunk, clock):
+    data = b"".join(chunk)
+    t0 = time.perf_counter()
+    f.write(data)
+    clock.io += time.perf_counter() - t0
+    clock.bytes_written += len(data)
+    return len(chunk)
+
+
+def _find(path, key, clock):
+    """Binary search a sorted level file for key."""
+    t0 = time.perf_counter()
+    with open(path, "rb") as f:
+        lo, hi = 0, os.path.getsize(path) // RECORD.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            f.seek(mid * RECORD.size)
+            rec = RECORD.unpack(f.read(RECORD.size))
+            if rec[0] < key:
+                lo = mid + 1
+            elif rec[0] > key:
+                hi = mid
+            else:
+                clock.io += time.perf_counter() - t0
+                return rec
+    clock.io += time.perf_counter() - t0
+    return None
+
+
+def _merge_new(runs, visited, clock):
+    """Merge sorted runs, keep the first record per key, drop keys in the visited file."""
+    merged = heapq.merge(*(_read_records(r, clock) for r in runs))
+    seen = _read_records(visited, clock, KEY)
+    head = next(seen, None)
+    last = None
+
+    for rec in merged:
+        key = rec[0]
+        if key == last:
+            continue
+        last = key
+
+        while head is not None and head[0] < key:
+            head = next(seen, None)
+        if head is None or head[0] != key:
+            yield rec
+
+
+def _merge_visited(visited, level, path, clock):
+    """Write the union of the visited keys and a (disjoint) level's keys to path."""
+    keys = heapq.merge(
+        _read_records(visited, clock, KEY),
+        ((rec[0],) for rec in _read_records(level, clock)),
+    )
+    _write_records(path, keys, clock, KEY)
+
+
+def external_bfs_plan(model, start_state, scratch_dir=None, buffer_size=1_000_000,
+                      max_nodes=100_000_000):
+    """
+    Returns (plan or None, stats).
+    stats: levels, states, io_time, compute_time, bytes_read, bytes_written
+    """
+    num_robots = len(start_state)
+    bits = model.cell_bits
+    if bits * num_robots > 64:
+        raise ValueError(
+            f"{num_robots} robots x {bits} bits per cell does not fit a 64-bit record")
+
+    mask = (1 << bits) - 1
+    clock = _Clock()
+    t_start = time.perf_counter()
+    stats = {"levels": 0, "states": 1}
+
+    def finish(plan):
+        total = time.perf_counter() - t_start
+        stats.update(
+            io_time=clock.io,
+            compute_time=total - clock.io,
+            bytes_read=clock.bytes_read,
+            bytes_written=clock.bytes_written,
+        )
+        return plan, stats
+
+    if model.is_terminal(start_state):
+        return finish([])
+
+    workdir = tempfile.mkdtemp(prefix="rr-bfs-", dir=scratch_dir)
+    try:
+        start = model.pack_state(start_state)
+        start_key = canonical_key([(start >> (bits * i)) & mask for i in range(num_robots)], bits)
+        levels = [os.path.join(workdir, "level-0")]
+        _write_records(levels[0], [(start_key, start, start, 0)], clock)
+        visited = os.path.join(workdir, "visited-0")
+        _write_records(visited, [(start_key,)], clock, KEY)
+        total = 1
+
+        while True:
+            depth = len(levels) - 1
+            runs = []
+            buffer = []
+
+            for _, packed, _, _ in _read_records(levels[-1], clock):
+                state = model.unpack_state(packed, num_robots)
+                for next_state, (robot, direction) in model.successors(state):
+                    move = robot * 4 + direction
+                    if model.is_terminal(next_state):
+                        plan = _reconstruct(levels, packed, move, num_robots, bits, clock)
+                        stats["levels"] = depth + 1
+                        return finish(plan)
+
+                    cells = [r * model.cols + c for r, c in next_state]
+                    child = 0
+                    for i, cell in enumerate(cells):
+                        child |= cell << (bits * i)
+                    buffer.append((canonical_key(cells, bits), child, packed, move))
+
+                    if len(buffer) >= buffer_size:
+                        runs.append(_write_run(workdir, depth, len(runs), buffer, clock))
+                        buffer = []
+
+            if buffer:
+                runs.append(_write_run(workdir, depth, len(runs), buffer, clock))
+                buffer = []
+            if not runs:
+                return finish(None)
+
+            next_level = os.path.join(workdir, f"level-{depth + 1}")
+            count = _write_records(next_level, _merge_new(runs, visited, clock), clock)
+            for run in runs:
+                os.remove(run)
+            if count:
+                merged = os.path.join(workdir, f"visited-{depth + 1}")
+                _merge_visited(visited, next_level, merged, clock)
+                os.remove(visited)
+                visited = merged
+
+            levels.append(next_level)
+            total += count
+            stats["levels"] = depth + 1
+            stats["states"] = total
+            if count == 0 or total > max_nodes:
+                return finish(None)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _write_run(workdir, depth, index, buffer, clock):
+    buffer.sort()
+    path = os.path.join(workdir, f"run-{depth}-{index}")
+
+    def unique():
+        last = None
+        for rec in buffer:
+            if rec[0] != last:
+                last = rec[0]
+                yield rec
+
+    _write_records(path, unique(), clock)
+    return path
+
+
+def _reconstruct(levels, packed, move, num_robots, bits, clock):
+    """Walk parent records back from the level that produced the goal."""
+    mask = (1 << bits) - 1
+    plan = [divmod(move, 4)]
+    for path in reversed(levels[1:]):
+        key = canonical_key([(packed >> (bits * i)) & mask for i in range(num_robots)], bits)
+        _, _, packed, move = _find(path, key, clock)
+        plan.append(divmod(move, 4))
+    plan.reverse()
+    return plan
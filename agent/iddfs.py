@@ -1,45 +1,85 @@
 from agent.agent import Agent
+from agent.pruning import RelevancePruner
+from model.cache import SuccessorCache
 
 class IDDFSAgent(Agent):
     
-    def __init__(self, model, max_depth=30, max_nodes=100_000):
+    def __init__(self, model, max_depth=30, max_nodes=100_000, prune=False,
+                 successor_cache_size=100_000):
+        """
+        prune                : skip blocker moves that cannot matter within the
+                               depth limit (agent.pruning); plans stay optimal
+        successor_cache_size : states whose successors are kept between
+                               iterations (0 disables)
+        """
         super().__init__(model)
         self.max_depth = max_depth
         self.max_nodes = max_nodes
+        self.prune = prune
+        self.successor_cache = SuccessorCache(successor_cache_size) if successor_cache_size else None
+        self.stats = {}
         self.plan = None
         self.plan_index = 0
-        self.last_start_state = None
+        self.expected_state = None
+        self.plan_optimal = False
+        self.truncated = False
     
     def choose_action(self, state):
-        if self.plan is None or state != self.last_start_state:
-            self.plan = self._iddfs_plan(state)
+        # Replan unless we are where the previous plan said we would be
+        if self.plan is None or state != self.expected_state:
+            self.plan = self._cached_plan(state)
             self.plan_index = 0
-            self.last_start_state = state
         
         if self.plan is None or self.plan_index >= len(self.plan):
             return None
         
         action = self.plan[self.plan_index]
         self.plan_index += 1
+        self.expected_state = self.model.transition(state, action)
         return action
     
+    def _cached_plan(self, state):
+        cache = self.model.cache
+        if cache is not None:
+            hit = cache.lookup(self.model, state)
+            if hit is not None and hit[1]:
+                return hit[0]
+        
+        plan = self._iddfs_plan(state)
+        if cache is not None and plan is not None:
+            cache.store(self.model, state, plan, optimal=self.plan_optimal)
+        return plan
+    
     def _iddfs_plan(self, start_state):
+        # The plan is only certified optimal if no shallower iteration hit max_nodes
+        self.plan_optimal = True
+        pruner = RelevancePruner(self.model, self.successor_cache) if self.prune else None
+        result = None
         for depth_limit in range(1, self.max_depth + 1):
-            result = self._depth_limited_search(start_state, depth_limit)
+            self.truncated = False
+            result = self._depth_limited_search(start_state, depth_limit, pruner)
             if result is not None:
-                return result
-        return None
+                break
+            if self.truncated:
+                self.plan_optimal = False
+        self.stats = pruner.stats() if pruner is not None else {}
+        if self.successor_cache is not None:
+            self.stats["successor_cache"] = self.successor_cache.stats()
+        return result
     
-    def _depth_limited_search(self, start_state, depth_limit):
-        stack = [(start_state, [], 0)]
+    def _depth_limited_search(self, start_state, depth_limit, pruner=None):
+        successor_cache = self.successor_cache
+        stack = [(start_state, [], 0, None, None)]
         visited = set()
         nodes_expanded = 0
+        table = None
         
         while stack:
-            current_state, path, depth = stack.pop()
+            current_state, path, depth, parent_state, parent_table = stack.pop()
             nodes_expanded += 1
             
             if nodes_expanded > self.max_nodes:
+                self.truncated = True
                 return None
             
             if self.model.is_terminal(current_state):
@@ -53,8 +93,15 @@ class IDDFSAgent(Agent):
                 continue
             visited.add(state_depth_key)
             
-            for next_state, action in self.model.successors(current_state):
+            if pruner is not None:
+                successors = pruner.successors(current_state, depth_limit - depth)
+            elif successor_cache is not None:
+                successors, table = successor_cache.lookup(
+                    self.model, current_state, parent_state, parent_table, path[-1] if path else None)
+            else:
+                successors = self.model.successors(current_state)
+            for next_state, action in successors:
                 new_path = path + [action]
-                stack.append((next_state, new_path, depth + 1))
+                stack.append((next_state, new_path, depth + 1, current_state, table))
         
         return None
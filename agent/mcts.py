@@ -1,41 +1,164 @@
 from agent.agent import Agent
+from model.cache import SuccessorCache
+import functools
 import math
 import random
+import sys
 
 import time
 
 UP, RIGHT, DOWN, LEFT = 0, 1, 2, 3
 
 class MCTSAgent(Agent):
-    def __init__(self, model, time=1, rollout_depth=15):
+    def __init__(self, model, time=1, rollout_depth=15, successor_cache_size=20_000, max_nodes=None):
+        """
+        successor_cache_size : states whose successors are kept for the tree
+                               and rollouts; rollout steps only fill free
+                               slots (0 disables)
+        max_nodes            : tree node budget; when reached, the least
+                               visited subtrees are collapsed and their nodes
+                               reused (None: unbounded)
+        """
         super().__init__(model)
         self.time = time
         self.rollout_depth = rollout_depth
+        self.max_nodes = max_nodes
+        self.successor_cache = SuccessorCache(successor_cache_size) if successor_cache_size else None
+        self.stats = {}
 
     def choose_action(self, state):
-        root = Node(state, self.model, self.rollout_depth)
+        cache = self.model.cache
+        if cache is not None:
+            hit = cache.lookup(self.model, state)
+            if hit is not None and hit[1] and hit[0]:
+                return hit[0][0]
+
+        ctx = TreeContext(self.model, self.rollout_depth, self.successor_cache, self.max_nodes)
+        root = ctx.root = ctx.new_node(state, None)
         end_time = time.time() + self.time
+        simulations = 0
         while time.time() < end_time:
             leaf = root.traverse()
             node = leaf.expand() or leaf
             reward = node.simulate()
             node.update(reward)
+            simulations += 1
+        self.stats["simulations"] = self.stats.get("simulations", 0) + simulations
+        self.stats["peak_nodes"] = max(self.stats.get("peak_nodes", 0), ctx.peak)
+        self.stats["pruned_nodes"] = self.stats.get("pruned_nodes", 0) + ctx.pruned
+        self.stats["bytes_per_node"] = node_bytes()
+        if self.successor_cache is not None:
+            self.stats["successor_cache"] = self.successor_cache.stats()
         if not root.children:
             return None
         return max(root.children.items(), key=lambda kv: kv[1].r / kv[1].n)[0]
 
+
+@functools.lru_cache(maxsize=None)
+def node_bytes():
+    """
+    Size of one tree node with an empty children dict, measured once from the
+    Node layout rather than by walking the tree. None where sys.getsizeof is
+    unsupported (PyPy raises TypeError).
+    """
+    node = Node(None, None)
+    try:
+        return sys.getsizeof(node) + sys.getsizeof(node.children)
+    except TypeError:
+        return None
+
+
+class TreeContext:
+    def __init__(self, model, rollout_depth, successor_cache=None, max_nodes=None):
+        """
+        Settings shared by every node of one search tree, plus the node budget:
+        a free list of recycled nodes and live / peak counts.
+        """
+        self.model = model
+        self.rollout_depth = rollout_depth
+        self.successor_cache = successor_cache
+        self.max_nodes = max_nodes
+        self.root = None
+        self.free = []
+        self.live = 0
+        self.peak = 0
+        self.pruned = 0
+
+    def new_node(self, state, parent):
+        if self.free:
+            node = self.free.pop()
+            node.parent = parent
+            node.s = state
+            node.r = 0.0
+            node.n = 0
+        else:
+            node = Node(state, self, parent)
+        self.live += 1
+        if self.live > self.peak:
+            self.peak = self.live
+        return node
+
+    def make_room(self, count, expanding):
+        """
+        Collapse the least visited expanded subtrees, smallest visit count
+        first, until count more nodes fit with a quarter of the budget spare.
+        Collapsed nodes keep their statistics and can expand again later;
+        the path from the root to `expanding` is never collapsed.
+        """
+        if self.max_nodes is None or self.live + count <= self.max_nodes:
+            return
+        target = min(self.max_nodes * 3 // 4, self.max_nodes - count)
+
+        path = set()
+        node = expanding
+        while node is not None:
+            path.add(id(node))
+            node = node.parent
+
+        expanded = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for child in node.children.values():
+                if child.children:
+                    expanded.append(child)
+                    stack.append(child)
+        expanded.sort(key=lambda node: node.n)
+
+        for node in expanded:
+            if self.live <= target:
+                break
+            # Freed nodes have no parent: skip those inside subtrees freed earlier
+            if node.parent is not None and id(node) not in path:
+                self.release_children(node)
+
+    def release_children(self, node):
+        stack = list(node.children.values())
+        node.children.clear()
+        while stack:
+            child = stack.pop()
+            stack.extend(child.children.values())
+            child.children.clear()
+            child.parent = None
+            child.s = None
+            self.free.append(child)
+            self.live -= 1
+            self.pruned += 1
+
+
 class Node:
-    def __init__(self, state, model, rollout_depth, parent=None):
+    __slots__ = ("parent", "children", "s", "r", "n", "ctx")
+
+    def __init__(self, state, ctx, parent=None):
         self.parent = parent
         self.children = {}
         self.s = state
-        self.model = model
-        self.rollout_depth = rollout_depth
+        self.ctx = ctx
         self.r = 0.0
         self.n = 0
 
     def add_child(self, action, child_state):
-        child = Node(child_state, self.model, self.rollout_depth, parent=self)
+        child = self.ctx.new_node(child_state, self)
         self.children[action] = child
         return child
 
@@ -56,23 +179,43 @@ class Node:
         return node
 
     def expand(self):
-        if self.model.is_terminal(self.s) or self.n == 0 or self.children:
+        ctx = self.ctx
+        if ctx.model.is_terminal(self.s) or self.n == 0 or self.children:
             return None
-        for next_state, action in self.model.successors(self.s):
+        if ctx.successor_cache is not None:
+            successors = ctx.successor_cache.lookup(ctx.model, self.s)[0]
+        else:
+            successors = list(ctx.model.successors(self.s))
+        ctx.make_room(len(successors), self)
+        for next_state, action in successors:
             self.add_child(action, next_state)
         return random.choice(tuple(self.children.values()))
 
     def simulate(self):
+        model = self.ctx.model
         state = self.s
         depth = 0
-        while not self.model.is_terminal(state) and depth < self.rollout_depth:
-            successors = list(self.model.successors(state))
+        cache = self.ctx.successor_cache
+        parent_state = parent_table = action = table = None
+        while not model.is_terminal(state) and depth < self.ctx.rollout_depth:
+            # Each rollout step moves one robot: misses derive the move table
+            # from the previous step's
+            if cache is not None:
+                successors, table = cache.lookup(
+                    model, state, parent_state, parent_table, action, evict=False)
+            elif parent_table is None:
+                table = model.move_table(state)
+                successors = list(model.successors_from_table(state, table))
+            else:
+                table = model.child_move_table(parent_state, parent_table, action, state)
+                successors = list(model.successors_from_table(state, table))
             if not successors:
                 break
+            parent_state, parent_table = state, table
             state, action = random.choice(successors)
             depth += 1
 
-        if self.model.is_terminal(state):
+        if model.is_terminal(state):
             return 1.0
         else:
             return 0.0
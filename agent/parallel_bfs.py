@@ -0,0 +1,231 @@
+from agent.agent import Agent
+from array import array
+import multiprocessing as mp
+import threading
+import time
+
+from model.model import RRModel, canonical_key
+
+# Records exchanged between processes are flat array('Q') triples:
+# (child packed state, parent packed state, robot * 4 + direction)
+RECORD = 3
+
+
+def _owner(key, num_workers):
+    return ((key * 0x9E3779B97F4A7C15) >> 32) % num_workers
+
+
+def _send_buckets(peers, buckets):
+    for q, peer in peers.items():
+        peer.send_bytes(buckets[q])
+
+
+def _worker(conn, peers, rows, cols, walls, worker_id, num_workers):
+    model = RRModel(rows, cols, walls, goal_pos=None)
+    bits = model.cell_bits
+    mask = (1 << bits) - 1
+    visited = {}        # canonical key -> (parent packed, move), owned states only
+    frontier = array("Q")
+    num_robots = 0
+    goal_cell = None
+
+    def cells_of(packed):
+        return [(packed >> (bits * i)) & mask for i in range(num_robots)]
+
+    while True:
+        cmd, arg = conn.recv()
+
+        if cmd == "seed":
+            start, num_robots, goal = arg
+            goal_cell = goal[0] * cols + goal[1]
+            model.goal = goal
+            visited.clear()
+            frontier = array("Q")
+            if _owner(canonical_key(cells_of(start), bits), num_workers) == worker_id:
+                visited[canonical_key(cells_of(start), bits)] = (start, 0)
+                frontier.append(start)
+
+        elif cmd == "level":
+            buckets = [array("Q") for _ in range(num_workers)]
+            for packed in frontier:
+                state = model.unpack_state(packed, num_robots)
+                for next_state, (robot, direction) in model.successors(state):
+                    cells = [r * cols + c for r, c in next_state]
+                    child = 0
+                    for i, cell in enumerate(cells):
+                        child |= cell << (bits * i)
+                    owner = _owner(canonical_key(cells, bits), num_workers)
+                    buckets[owner].extend((child, packed, robot * 4 + direction))
+
+            # Ship each owner its records directly. A thread sends, so a full
+            # pipe to one peer never stops us draining the others.
+            sender = threading.Thread(target=_send_buckets, args=(peers, buckets))
+            sender.start()
+            records = buckets[worker_id]
+            for peer in peers.values():
+                records.frombytes(peer.recv_bytes())
+            sender.join()
+
+            frontier = array("Q")
+            found = None
+            for j in range(0, len(records), RECORD):
+                child = records[j]
+                key = canonical_key(cells_of(child), bits)
+                if key in visited:
+                    continue
+                visited[key] = (records[j + 1], records[j + 2])
+                frontier.append(child)
+                if found is None and child & mask == goal_cell:
+                    found = child
+            conn.send((len(frontier), found))
+
+        elif cmd == "parent":
+            conn.send(visited.get(canonical_key(cells_of(arg), bits)))
+
+        elif cmd == "stop":
+            conn.close()
+            return
+
+
+class ParallelBFSAgent(Agent):
+    def __init__(self, model, workers=4, max_nodes=10_000_000):
+        """
+        Level-synchronous BFS across worker processes.
+
+        Each worker owns the states whose canonical key hashes to it: it keeps
+        their visited entries and expands them. Per level, workers expand their
+        frontier slice and ship successors in bulk to the owning worker over a
+        pipe between the two, which dedupes them and forms its part of the next
+        frontier. The parent only exchanges commands and frontier sizes.
+        """
+        super().__init__(model)
+        self.workers = workers
+        self.max_nodes = max_nodes
+        self.plan = None
+        self.plan_index = 0
+        self.expected_state = None
+        self.stats = {}
+
+    def choose_action(self, state):
+        # Replan unless we are where the previous plan said we would be
+        if self.plan is None or state != self.expected_state:
+            self.plan = self._cached_plan(state)
+            self.plan_index = 0
+
+        if self.plan is None or self.plan_index >= len(self.plan):
+            return None
+
+        action = self.plan[self.plan_index]
+        self.plan_index += 1
+        self.expected_state = self.model.transition(state, action)
+        return action
+
+    def _cached_plan(self, state):
+        cache = self.model.cache
+        if cache is not None:
+            hit = cache.lookup(self.model, state)
+            if hit is not None and hit[1]:
+                return hit[0]
+
+        plan = self._parallel_bfs_plan(state)
+        if cache is not None and plan is not None:
+            cache.store(self.model, state, plan, optimal=True)
+        return plan
+
+    def _parallel_bfs_plan(self, start_state):
+        model = self.model
+        if model.is_terminal(start_state):
+            return []
+        if model.cell_bits * len(start_state) > 64:
+            raise ValueError(
+                f"{len(start_state)} robots x {model.cell_bits} bits per cell does not fit "
+                "the 64-bit records exchanged between workers")
+
+        start_time = time.perf_counter()
+        # peers[w][q]: worker w's end of the pipe between workers w and q
+        peers = [{} for _ in range(self.workers)]
+        for w in range(self.workers):
+            for q in range(w + 1, self.workers):
+                peers[w][q], peers[q][w] = mp.Pipe()
+
+        conns, procs = [], []
+        for wid in range(self.workers):
+            parent_conn, child_conn = mp.Pipe()
+            proc = mp.Process(
+                target=_worker,
+                args=(child_conn, peers[wid], model.rows, model.cols, model.walls, wid, self.workers),
+                daemon=True,
+            )
+            proc.start()
+            child_conn.close()
+            conns.append(parent_conn)
+            procs.append(proc)
+        for ends in peers:
+            for peer in ends.values():
+                peer.close()
+
+        try:
+            return self._search(conns, start_state, start_time)
+        finally:
+            for conn in conns:
+                try:
+                    conn.send(("stop", None))
+                except (BrokenPipeError, OSError):
+                    # That worker is gone; don't mask the error that got us here
+                    pass
+                conn.close()
+            for proc in procs:
+                proc.join(timeout=1)
+                if proc.is_alive():
+                    # Still waiting on a dead peer mid-level
+                    proc.terminate()
+                    proc.join()
+
+    def _search(self, conns, start_state, start_time):
+        model = self.model
+        num_robots = len(start_state)
+        start = model.pack_state(start_state)
+
+        for conn in conns:
+            conn.send(("seed", (start, num_robots, model.goal)))
+
+        total = 1
+        depth = 0
+        frontier_size = 1
+        self.stats = {"levels": 0, "states": 1, "workers": self.workers}
+
+        while frontier_size:
+            for conn in conns:
+                conn.send(("level", None))
+
+            frontier_size = 0
+            found = None
+            for conn in conns:
+                size, goal_state = conn.recv()
+                frontier_size += size
+                if found is None and goal_state is not None:
+                    found = goal_state
+
+            depth += 1
+            total += frontier_size
+            self.stats.update(levels=depth, states=total, time=time.perf_counter() - start_time)
+
+            if found is not None:
+                return self._reconstruct(conns, found, start, num_robots)
+            if total > self.max_nodes:
+                return None
+
+        return None
+
+    def _reconstruct(self, conns, packed, start, num_robots):
+        bits = self.model.cell_bits
+        mask = (1 << bits) - 1
+        plan = []
+        while packed != start:
+            cells = [(packed >> (bits * i)) & mask for i in range(num_robots)]
+            conn = conns[_owner(canonical_key(cells, bits), len(conns))]
+            conn.send(("parent", packed))
+            packed, move = conn.recv()
+            plan.append(divmod(move, 4))
+        plan.reverse()
+        return plan
@@ -0,0 +1,169 @@
+from agent.agent import Agent
+import multiprocessing as mp
+import queue
+import time
+
+from agent.registry import make_agent
+from model.model import RRModel
+
+# Agents whose plans are shortest whenever they find one
+OPTIMAL_AGENTS = {"bfs", "parbfs", "batchbfs"}
+
+DEFAULT_MEMBERS = [
+    ("bfs", {"max_nodes": 100_000}),
+    ("iddfs", {"max_depth": 100, "max_nodes": 100_000}),
+    ("mcts", {"time": 0.5, "rollout_depth": 100}),
+]
+
+
+def _run_member(results, index, name, kwargs, rows, cols, walls, goal, start, max_moves):
+    model = RRModel(rows, cols, walls, goal_pos=goal)
+    agent = make_agent(name, model, num_robots=len(start), **kwargs)
+    t0 = time.perf_counter()
+    plan_from = getattr(agent, "_cached_plan", None)
+    if plan_from is None:
+        plan = agent.solve(start, max_moves=max_moves)
+    else:
+        # One search from start, so plan_optimal (IDDFS) describes this plan:
+        # set only if no iteration below the plan's depth hit max_nodes
+        plan = plan_from(start)
+        if plan is not None and len(plan) > max_moves:
+            plan = None
+    elapsed = time.perf_counter() - t0
+    optimal = plan is not None and (
+        name in OPTIMAL_AGENTS or getattr(agent, "plan_optimal", False))
+    results.put((index, plan, optimal, elapsed))
+
+
+class PortfolioAgent(Agent):
+    def __init__(self, model, members=None, deadline=10.0, max_moves=50):
+        """
+        Race several agents on the same state, one process each.
+
+        members  : list of (registry name, constructor kwargs)
+        deadline : seconds to wait before settling for the best plan so far
+
+        The first plan certified optimal wins outright and the other members
+        are terminated; otherwise the shortest plan returned by the deadline
+        (or once every member has finished) is used.
+        """
+        super().__init__(model)
+        self.members = members or DEFAULT_MEMBERS
+        self.deadline = deadline
+        self.max_moves = max_moves
+        self.plan = None
+        self.plan_index = 0
+        self.expected_state = None
+        self.history = []
+
+    def choose_action(self, state):
+        # Races are expensive, so keep following the plan while the state is
+        # the one it predicts and only race again if it diverges.
+        if self.plan is None or state != self.expected_state:
+            self.plan = self._race(state)
+            self.plan_index = 0
+
+        if self.plan is None or self.plan_index >= len(self.plan):
+            return None
+
+        action = self.plan[self.plan_index]
+        self.plan_index += 1
+        self.expected_state = self.model.transition(state, action)
+        return action
+
+    def solve(self, state, max_moves=50):
+        # The race already produces a whole plan; no need to step through it
+        if self.model.is_terminal(state):
+            return []
+        plan = self._race(state)
+        return plan if plan is not None and len(plan) <= max_moves else None
+
+    def _race(self, start_state):
+        model = self.model
+        cache = model.cache
+        if cache is not None:
+            hit = cache.lookup(model, start_state)
+            if hit is not None and hit[1]:
+                return hit[0]
+
+        results = mp.Queue()
+        procs = []
+        t0 = time.perf_counter()
+        for index, (name, kwargs) in enumerate(self.members):
+            proc = mp.Process(
+                target=_run_member,
+                args=(results, index, name, kwargs, model.rows, model.cols, model.walls,
+                      model.goal, start_state, self.max_moves),
+            )
+            proc.start()
+            procs.append(proc)
+
+        best = None     # (plan, optimal, index, elapsed)
+        pending = len(procs)
+        end_time = t0 + self.deadline
+        try:
+            while pending:
+                remaining = end_time - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    index, plan, optimal, elapsed = results.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending -= 1
+
+                if plan is None:
+                    continue
+                if best is None or optimal or len(plan) < len(best[0]):
+                    best = (plan, optimal, index, elapsed)
+                if optimal:
+                    break
+        finally:
+            for proc in procs:
+                if proc.is_alive():
+                    proc.terminate()
+            for proc in procs:
+                proc.join()
+            results.close()
+
+        self._log(start_state, best, time.perf_counter() - t0)
+
+        if best is None:
+            return None
+        plan, optimal, _, _ = best
+        if cache is not None:
+            cache.store(model, start_state, plan, optimal=optimal)
+        return plan
+
+    def _log(self, start_state, best, wall_time):
+        entry = {
+            "class": (self.model.rows, len(start_state)),
+            "winner": None if best is None else self.members[best[2]][0],
+            "optimal": False if best is None else best[1],
+            "moves": None if best is None else len(best[0]),
+            "member_time": None if best is None else best[3],
+            "race_time": wall_time,
+        }
+        self.history.append(entry)
+        return entry
+
+    def summary(self):
+        return summarize_history(self.history)
+
+
+def summarize_history(entries):
+    """
+    Wins and average race time per puzzle class (board size, robot count) and member.
+    Returns {(size, robots): {member: {"wins": n, "avg_time": s}}}
+    """
+    table = {}
+    for entry in entries:
+        winner = entry["winner"] or "none"
+        row = table.setdefault(entry["class"], {}).setdefault(winner, {"wins": 0, "time": 0.0})
+        row["wins"] += 1
+        row["time"] += entry["race_time"]
+
+    for members in table.values():
+        for row in members.values():
+            row["avg_time"] = row.pop("time") / row["wins"]
+    return table
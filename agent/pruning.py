@@ -0,0 +1,89 @@
+"""
+Opt-in relevance pruning of blocker moves for depth-bounded searches.
+
+With `remaining` moves left and h = model.distance_map() at the target
+robot, any solution spends at least h moves on the target (h is relaxed),
+so at most slack = remaining - h on blockers:
+
+    slack < 0  : no solution within the bound, nothing is expanded
+    slack == 0 : only target moves
+    slack == 1 : one blocker move at most, after which the target uses only
+                 cells x with h(x) <= remaining - 1. A blocker move matters
+                 only if its old or new cell is on the row or column of such
+                 a cell; otherwise dropping it gives a shorter solution, so
+                 an optimal path never makes it.
+    slack >= 2 : everything (blocker moves can set up other blocker moves)
+
+Optimal paths survive, so BFS (bounded by any known plan length) and
+IDDFS stay optimal.
+"""
+
+
+class RelevancePruner:
+    def __init__(self, model, successor_cache=None):
+        """
+        One pruner per search: the distance map is taken for the current goal.
+        successor_cache : optional SuccessorCache to draw successors from
+        """
+        self.model = model
+        self.successor_cache = successor_cache
+        self.dist = model.distance_map()
+        self.generated = 0
+        self.pruned = 0
+        self._lines = {}
+
+    def lines(self, budget):
+        """(rows, cols) containing a cell the target can still use with budget moves."""
+        lines = self._lines.get(budget)
+        if lines is None:
+            cols = self.model.cols
+            rows_used, cols_used = set(), set()
+            for cell, d in enumerate(self.dist):
+                if d <= budget:
+                    r, c = divmod(cell, cols)
+                    rows_used.add(r)
+                    cols_used.add(c)
+            lines = self._lines[budget] = (rows_used, cols_used)
+        return lines
+
+    def successors(self, state, remaining):
+        """model.successors(state), minus moves that cannot be on an optimal path within remaining."""
+        r, c = state[0]
+        slack = remaining - self.dist[r * self.model.cols + c]
+        if slack < 0:
+            return
+
+        if self.successor_cache is not None and slack > 0:
+            # At slack 0 only the target's four slides are needed; cheaper fresh
+            successors = self.successor_cache.lookup(self.model, state)[0]
+        else:
+            successors = self.model.successors(state)
+
+        if slack >= 2:
+            for item in successors:
+                self.generated += 1
+                yield item
+            return
+
+        rows_used, cols_used = self.lines(remaining - 1)
+        for next_state, (robot, direction) in successors:
+            if robot != 0:
+                if slack == 0:
+                    # successors() yields robot by robot, the target first,
+                    # so no blocker slide needs computing at all
+                    break
+                (orr, oc), (nr, nc) = state[robot], next_state[robot]
+                if not (orr in rows_used or oc in cols_used or nr in rows_used or nc in cols_used):
+                    self.pruned += 1
+                    continue
+            self.generated += 1
+            yield next_state, (robot, direction)
+
+    def stats(self):
+        # Blocker moves skipped wholesale at slack 0 are not counted as pruned
+        total = self.generated + self.pruned
+        return {
+            "generated": self.generated,
+            "pruned": self.pruned,
+            "prune_rate": self.pruned / total if total else 0.0,
+        }
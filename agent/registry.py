@@ -0,0 +1,34 @@
+import importlib
+
+# name -> (module, class); modules are only imported when an agent is built
+AGENTS = {
+    "bfs":   ("agent.bfs", "BFSAgent"),
+    "iddfs": ("agent.iddfs", "IDDFSAgent"),
+    "mcts":  ("agent.mcts", "MCTSAgent"),
+    "viter": ("agent.rl", "ValueIterationAgent"),
+    "parbfs": ("agent.parallel_bfs", "ParallelBFSAgent"),
+    "batchbfs": ("agent.batch_bfs", "BatchBFSAgent"),
+    "portfolio": ("agent.portfolio", "PortfolioAgent"),
+    "astar": ("agent.astar", "WeightedAStarAgent"),
+    "beam":  ("agent.beam", "BeamSearchAgent"),
+}
+
+
+def get_agent_class(name):
+    """Return the agent class registered under name."""
+    try:
+        module_name, class_name = AGENTS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown agent {name!r} (choose from {', '.join(AGENTS)})")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def make_agent(name, model, num_robots=None, **kwargs):
+    """
+    Build a registered agent for model.
+    num_robots is only forwarded to agents that need it (value iteration).
+    """
+    cls = get_agent_class(name)
+    if name.lower() == "viter":
+        kwargs.setdefault("num_robots", num_robots)
+    return cls(model, **kwargs)
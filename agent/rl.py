@@ -1,14 +1,40 @@
 from agent.agent import Agent
 from collections import defaultdict
+import heapq
+
+from model.model import canonical
+
+MODES = ("sweep", "prioritized")
+
 
 class ValueIterationAgent(Agent):
-    def __init__(self, model, num_robots, discount=0.9, num_iterations=100):
+    def __init__(self, model, num_robots, discount=0.9, num_iterations=100, mode="sweep",
+                 theta=1e-6, batch_size=1000, max_states=2_000_000):
+        """
+        mode : "sweep"       - num_iterations full sweeps over get_states()
+               "prioritized" - discover states reachable from the current state
+                               batch_size expansions at a time, back up values
+                               in order of their change (prioritized sweeping)
+                               and stop once the start value moves by < theta
+                               between batches; goal states are absorbing
+        max_states : prioritized mode gives up past this many discovered states;
+                     the start state is remembered as failed so later calls
+                     return None instead of rebuilding the state space
+        """
         super().__init__(model)
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}")
         self.num_robots = num_robots
         self.discount = discount
         self.num_iterations = num_iterations
+        self.mode = mode
+        self.theta = theta
+        self.batch_size = batch_size
+        self.max_states = max_states
         self.values = defaultdict(float)
         self.planned = False
+        self.failed = set()
+        self.stats = {}
 
     def run_value_iteration(self):
         for i in range(self.num_iterations):
@@ -29,18 +55,98 @@ class ValueIterationAgent(Agent):
 
         self.planned = True
 
+    def run_prioritized_sweeping(self, start_state):
+        """Plan from start_state over the states reachable from it; values keyed canonically."""
+        model = self.model
+        gamma = self.discount
+        values = self.values = defaultdict(float)
+        successors = {}
+        predecessors = defaultdict(list)
+        heap = []
+        counter = 0
+
+        start = canonical(start_state)
+        frontier = [start_state]
+        discovered = {start}
+        head = 0
+        backups = 0
+        previous = None
+
+        while True:
+            # Discover: expand the next batch of states in BFS order
+            end = min(head + self.batch_size, len(frontier))
+            for state in frontier[head:end]:
+                key = canonical(state)
+                succ = []
+                for next_state, _ in model.successors(state):
+                    next_key = canonical(next_state)
+                    succ.append(next_key)
+                    predecessors[next_key].append(key)
+                    if next_key in discovered:
+                        continue
+                    discovered.add(next_key)
+                    if model.is_terminal(next_state):
+                        values[next_key] = 1.0
+                    else:
+                        frontier.append(next_state)
+                successors[key] = succ
+                if any(values.get(k, 0.0) > 0 for k in succ):
+                    heapq.heappush(heap, (-1.0, counter, key))
+                    counter += 1
+            head = end
+
+            # Sweep: back up values in order of priority
+            while heap and -heap[0][0] > self.theta:
+                _, _, key = heapq.heappop(heap)
+                succ = successors.get(key)
+                if not succ:
+                    continue
+                new = gamma * max(values[k] for k in succ)
+                change = abs(new - values[key])
+                values[key] = new
+                backups += 1
+                if change > self.theta:
+                    for pred in predecessors[key]:
+                        heapq.heappush(heap, (-change * gamma, counter, pred))
+                        counter += 1
+            heap.clear()
+
+            stable = previous is not None and values[start] > 0 and abs(values[start] - previous) < self.theta
+            previous = values[start]
+            if stable or head >= len(frontier) or len(discovered) > self.max_states:
+                break
+
+        self.stats = {"discovered": len(discovered), "expanded": len(successors), "backups": backups}
+        self.planned = True
+
+    def _value(self, state):
+        if self.mode == "prioritized":
+            return self.values.get(canonical(state), 0.0)
+        return self.values[state]
+
     def choose_action(self, state):
         if self.model.is_terminal(state):
             return None
 
-        if not self.planned:
+        if self.mode == "prioritized":
+            key = canonical(state)
+            if key in self.failed:
+                return None
+            if not self.planned or self._value(state) <= 0:
+                self.run_prioritized_sweeping(state)
+                # Goal not reached within max_states (or unreachable): give up
+                # on this state for good rather than sweeping again next call
+                if self._value(state) <= 0:
+                    self.failed.add(key)
+                    return None
+        elif not self.planned:
             self.run_value_iteration()
 
         best_action = None
         best_val = -float('inf')
         for next_state, action in self.model.successors(state):
-            if self.values[next_state] > best_val:
-                best_val = self.values[next_state]
+            if self._value(next_state) > best_val:
+                best_val = self._value(next_state)
                 best_action = action
 
         return best_action
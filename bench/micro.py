@@ -0,0 +1,172 @@
+"""
+Micro-benchmarks for RRModel primitives.
+
+Each primitive runs over a pool of scrambled states, calibrated so one repeat
+takes at least --min-time seconds, after --warmup untimed repeats. Reports
+median ops/s and the interquartile range over --repeats.
+
+    python -m bench.micro
+    pypy3 -m bench.micro --robots 2 3 4 --densities 0 0.1 0.3 --json micro-pypy.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from model.model import DIRS, OPPOSITE, WALL_BITS, RRModel
+from utils.board import generate_rr_board
+from utils.puzzle_generator import generate_solvable_puzzle, scramble_state
+
+POOL_SIZE = 256
+
+
+def make_board(size, density, rng):
+    """Standard board plus random extra wall segments on `density` of the cells."""
+    walls, targets = generate_rr_board(size, size)
+    for _ in range(int(density * size * size)):
+        r, c = rng.randrange(size), rng.randrange(size)
+        direction = rng.choice(list(DIRS))
+        dr, dc = DIRS[direction]
+        if 0 <= r + dr < size and 0 <= c + dc < size:
+            walls[r][c] |= WALL_BITS[direction]
+            walls[r + dr][c + dc] |= WALL_BITS[OPPOSITE[direction]]
+    return walls, targets
+
+
+def make_cases(model, states):
+    """name -> (function taking one pool index, ops per call)"""
+    n = len(states)
+    actions = [(i % len(states[0]), i % 4) for i in range(n)]
+    packed = [model.pack_state(s) for s in states]
+    num_robots = len(states[0])
+    # Built here so slide() times only the slide, not the set construction
+    blockers = [set(s[1:]) for s in states]
+
+    def slide(i):
+        r, c = states[i % n][0]
+        model._slide(r, c, i & 3, blockers[i % n])
+
+    def transition(i):
+        model.transition(states[i % n], actions[i % n])
+
+    def successors(i):
+        for _ in model.successors(states[i % n]):
+            pass
+
+    def is_terminal(i):
+        model.is_terminal(states[i % n])
+
+    def state_hash(i):
+        hash(states[i % n])
+
+    def pack(i):
+        model.pack_state(states[i % n])
+
+    def unpack(i):
+        model.unpack_state(packed[i % n], num_robots)
+
+    def scramble(i):
+        scramble_state(model, states[i % n], steps=10)
+
+    return {
+        "_slide": (slide, 1),
+        "transition": (transition, 1),
+        "successors": (successors, 1),
+        "is_terminal": (is_terminal, 1),
+        "hash": (state_hash, 1),
+        "pack_state": (pack, 1),
+        "unpack_state": (unpack, 1),
+        "scramble_state": (scramble, 10),
+    }
+
+
+def calibrate(fn, min_time):
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for i in range(loops):
+            fn(i)
+        if time.perf_counter() - t0 >= min_time:
+            return loops
+        loops *= 2
+
+
+def measure(fn, ops_per_call, warmup, repeats, min_time):
+    loops = calibrate(fn, min_time)
+    rates = []
+    for k in range(warmup + repeats):
+        t0 = time.perf_counter()
+        for i in range(loops):
+            fn(i)
+        elapsed = time.perf_counter() - t0
+        if k >= warmup:
+            rates.append(loops * ops_per_call / elapsed)
+
+    q1, median, q3 = statistics.quantiles(rates, n=4) if len(rates) > 1 else (rates[0],) * 3
+    return {"median": median, "iqr": q3 - q1, "q1": q1, "q3": q3, "loops": loops, "repeats": len(rates)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--robots", type=int, nargs="+", default=[2, 3, 4])
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.0, 0.2])
+    parser.add_argument("--size", type=int, default=16)
+    parser.add_argument("--only", nargs="+", help="primitives to run (default: all)")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    random.seed(args.seed)
+    impl = platform.python_implementation()
+    results = []
+
+    print(f"{impl} {platform.python_version()}", file=sys.stderr)
+    print(f"{'Primitive':<16} {'Robots':<8} {'Density':<9} {'Median ops/s':<14} {'IQR':<12}",
+          file=sys.stderr)
+    print("-" * 62, file=sys.stderr)
+
+    for density in args.densities:
+        walls, targets = make_board(args.size, density, rng)
+        model = RRModel(args.size, args.size, walls, goal_pos=None)
+
+        for robots in args.robots:
+            states = []
+            for _ in range(POOL_SIZE):
+                start, goal = generate_solvable_puzzle(model, targets, robots, scramble_steps=50)
+                states.append(start)
+            model.goal = goal
+
+            for name, (fn, ops) in make_cases(model, states).items():
+                if args.only and name not in args.only:
+                    continue
+                stats = measure(fn, ops, args.warmup, args.repeats, args.min_time)
+                results.append(dict(primitive=name, robots=robots, density=density,
+                                    size=args.size, **stats))
+                print(f"{name:<16} {robots:<8} {density:<9} {stats['median']:<14,.0f} "
+                      f"{stats['iqr']:<12,.0f}", file=sys.stderr)
+
+    report = {
+        "implementation": impl,
+        "python_version": platform.python_version(),
+        "machine": platform.machine(),
+        "warmup": args.warmup,
+        "repeats": args.repeats,
+        "results": results,
+    }
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
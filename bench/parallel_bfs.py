@@ -0,0 +1,64 @@
+"""
+Speedup of ParallelBFSAgent per worker count against serial BFS.
+
+    python -m bench.parallel_bfs --robots 4 --puzzles 5 --workers 1 2 4 8
+"""
+
+import argparse
+import random
+import time
+
+from agent.bfs import BFSAgent
+from agent.parallel_bfs import ParallelBFSAgent
+from model.model import RRModel
+from utils.board import generate_rr_board
+from utils.puzzle_generator import generate_solvable_puzzle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--robots", type=int, default=4)
+    parser.add_argument("--puzzles", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--scramble", type=int, default=1000)
+    parser.add_argument("--max-nodes", type=int, default=10_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    walls, targets = generate_rr_board()
+    model = RRModel(16, 16, walls, goal_pos=None)
+    puzzles = [
+        generate_solvable_puzzle(model, targets, args.robots, args.scramble)
+        for _ in range(args.puzzles)
+    ]
+
+    def run(make_agent):
+        total = 0.0
+        lengths = []
+        for start, goal in puzzles:
+            model.goal = goal
+            agent = make_agent()
+            t0 = time.perf_counter()
+            plan = agent._cached_plan(start)
+            total += time.perf_counter() - t0
+            lengths.append(None if plan is None else len(plan))
+        return total, lengths
+
+    serial_time, serial_lengths = run(
+        lambda: BFSAgent(model, max_nodes=args.max_nodes, storage="bitset"))
+
+    print(f"\n{args.puzzles} puzzles, {args.robots} robots, optimal lengths {serial_lengths}")
+    print(f"{'Agent':<16} {'Time (s)':<12} {'Speedup':<10} {'Same lengths'}")
+    print("-" * 60)
+    print(f"{'BFS (serial)':<16} {serial_time:<12.3f} {1.0:<10.2f} -")
+
+    for workers in args.workers:
+        t, lengths = run(
+            lambda: ParallelBFSAgent(model, workers=workers, max_nodes=args.max_nodes))
+        same = "yes" if lengths == serial_lengths else "NO"
+        print(f"{f'ParBFS x{workers}':<16} {t:<12.3f} {serial_time / t:<10.2f} {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Relevance pruning (agent.pruning) on and off for BFS and IDDFS.
+
+Counts model.successors() calls (expanded nodes, including the weighted A*
+run that bounds pruned BFS) and derives the effective branching factor b*
+from N = 1 + b* + ... + b*^(d-1) for a plan of length d.
+
+    python -m bench.pruning --robots 3 4 --puzzles 10
+"""
+
+import argparse
+import random
+import time
+
+from agent.bfs import BFSAgent
+from agent.iddfs import IDDFSAgent
+from model.model import RRModel
+from utils.board import generate_rr_board
+from utils.puzzle_generator import generate_solvable_puzzle
+
+
+def effective_branching(nodes, depth):
+    """Solve nodes = sum(b^i for i < depth) for b by bisection."""
+    if depth <= 1 or nodes <= depth:
+        return 1.0
+    lo, hi = 1.0, float(nodes)
+    for _ in range(100):
+        mid = (lo + hi) / 2
+        if sum(mid ** i for i in range(depth)) < nodes:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def run(model, puzzles, make_agent):
+    calls = [0]
+    inner = model.successors
+
+    def successors(state):
+        calls[0] += 1
+        return inner(state)
+
+    model.successors = successors
+    rows = []
+    try:
+        for start, goal in puzzles:
+            model.goal = goal
+            calls[0] = 0
+            t0 = time.perf_counter()
+            plan = make_agent()._cached_plan(start)
+            elapsed = time.perf_counter() - t0
+            length = None if plan is None else len(plan)
+            rows.append((length, calls[0], elapsed))
+    finally:
+        del model.successors
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--robots", type=int, nargs="+", default=[3, 4])
+    parser.add_argument("--puzzles", type=int, default=10)
+    parser.add_argument("--scramble", type=int, default=1000)
+    parser.add_argument("--max-nodes", type=int, default=2_000_000)
+    parser.add_argument("--no-iddfs", action="store_true", help="skip IDDFS (slow without pruning)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    walls, targets = generate_rr_board()
+    model = RRModel(16, 16, walls, goal_pos=None)
+
+    configs = [
+        ("BFS", lambda: BFSAgent(model, max_nodes=args.max_nodes)),
+        ("BFS+prune", lambda: BFSAgent(model, max_nodes=args.max_nodes, prune=True)),
+    ]
+    if not args.no_iddfs:
+        configs += [
+            ("IDDFS", lambda: IDDFSAgent(model, max_depth=30, max_nodes=args.max_nodes)),
+            ("IDDFS+prune", lambda: IDDFSAgent(model, max_depth=30, max_nodes=args.max_nodes,
+                                               prune=True)),
+        ]
+
+    for robots in args.robots:
+        puzzles = [generate_solvable_puzzle(model, targets, robots, args.scramble)
+                   for _ in range(args.puzzles)]
+        results = {name: run(model, puzzles, make) for name, make in configs}
+        reference = [length for length, _, _ in results["BFS"]]
+
+        print(f"\n--- {robots} ROBOTS, {args.puzzles} puzzles, optimal lengths {reference} ---")
+        print(f"{'Search':<14} {'Solved':<8} {'Expanded':<12} {'b*':<8} {'Time (s)':<10} {'Same lengths'}")
+        print("-" * 66)
+        for name, rows in results.items():
+            solved = [r for r in rows if r[0] is not None]
+            expanded = sum(r[1] for r in rows)
+            b = [effective_branching(n, d) for d, n, _ in solved]
+            avg_b = sum(b) / len(b) if b else float("nan")
+            same = "yes" if [r[0] for r in rows] == reference else "NO"
+            print(f"{name:<14} {len(solved):<8} {expanded:<12} {avg_b:<8.2f} "
+                  f"{sum(r[2] for r in rows):<10.3f} {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Agent time, peak memory and success rate against board size and robot count.
+
+Time and peak memory come from separate runs of each puzzle, so times do
+not include tracemalloc overhead. Plan-based agents are timed on one search
+from the start state; online agents (MCTS, value iteration) on solve().
+
+    python -m bench.scaling --sizes 16 32 64 --robots 2 4 6 8 --trials 3
+    python -m bench.scaling --agents bfs iddfs mcts --csv scaling.csv --plot scaling.png
+"""
+
+import argparse
+import csv
+import random
+import time
+import tracemalloc
+
+from agent.registry import make_agent
+from model.model import RRModel
+from utils.board import generate_rr_board
+from utils.puzzle_generator import generate_solvable_puzzle
+
+# Budgets match the ones test.py uses on 16x16
+BUDGETS = {
+    "bfs": {"max_nodes": 100_000},
+    "iddfs": {"max_depth": 100, "max_nodes": 100_000},
+    "mcts": {"time": 0.5, "rollout_depth": 100, "max_nodes": 100_000},
+    "astar": {"weight": 2.0, "max_nodes": 100_000},
+    "beam": {"beam_width": 500, "max_nodes": 200_000},
+}
+
+
+def solve_once(agent, start, max_moves):
+    plan_from = getattr(agent, "_cached_plan", None)
+    if plan_from is None:
+        return agent.solve(start, max_moves=max_moves)
+    plan = plan_from(start)
+    return plan if plan is not None and len(plan) <= max_moves else None
+
+
+def run_config(agent_name, size, robots, trials, scramble_steps, max_moves):
+    walls, targets = generate_rr_board(size, size)
+    model = RRModel(size, size, walls, goal_pos=None)
+
+    successes = 0
+    times, peaks, moves = [], [], []
+    for _ in range(trials):
+        start, goal = generate_solvable_puzzle(model, targets, robots, scramble_steps)
+        model.goal = goal
+        budget = BUDGETS.get(agent_name, {})
+
+        agent = make_agent(agent_name, model, num_robots=robots, **budget)
+        t0 = time.perf_counter()
+        plan = solve_once(agent, start, max_moves)
+        times.append(time.perf_counter() - t0)
+
+        agent = make_agent(agent_name, model, num_robots=robots, **budget)
+        tracemalloc.start()
+        solve_once(agent, start, max_moves)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        if plan is not None:
+            successes += 1
+            moves.append(len(plan))
+
+    return {
+        "agent": agent_name,
+        "size": size,
+        "robots": robots,
+        "success": successes / trials,
+        "avg_moves": sum(moves) / len(moves) if moves else None,
+        "avg_time": sum(times) / trials,
+        "peak_mb": max(peaks) / 2**20,
+    }
+
+
+def plot(rows, path):
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        raise SystemExit("--plot needs matplotlib (pip install matplotlib)")
+
+    metrics = [("avg_time", "Avg time (s)"), ("peak_mb", "Peak memory (MB)"), ("success", "Success rate")]
+    sizes = sorted({r["size"] for r in rows})
+    fig, axes = plt.subplots(len(metrics), len(sizes), figsize=(4 * len(sizes), 3 * len(metrics)),
+                             squeeze=False)
+
+    for col, size in enumerate(sizes):
+        for row, (key, label) in enumerate(metrics):
+            ax = axes[row][col]
+            for agent in sorted({r["agent"] for r in rows}):
+                points = sorted((r["robots"], r[key]) for r in rows
+                                if r["size"] == size and r["agent"] == agent)
+                ax.plot([p[0] for p in points], [p[1] for p in points], marker="o", label=agent)
+            if key != "success":
+                ax.set_yscale("log")
+            ax.set_title(f"{size}x{size}")
+            ax.set_xlabel("Robots")
+            ax.set_ylabel(label)
+    axes[0][0].legend()
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--agents", nargs="+", default=["bfs", "iddfs"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 32, 64])
+    parser.add_argument("--robots", type=int, nargs="+", default=[2, 4, 6, 8])
+    parser.add_argument("--trials", type=int, default=3)
+    parser.add_argument("--scramble", type=int, default=1000)
+    parser.add_argument("--max-moves", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", metavar="PATH")
+    parser.add_argument("--plot", metavar="PATH", help="write a PNG (needs matplotlib)")
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    rows = []
+
+    print(f"{'Agent':<8} {'Board':<8} {'Robots':<8} {'Success %':<10} {'Avg Moves':<10} "
+          f"{'Avg Time (s)':<13} {'Peak MB'}")
+    print("-" * 72)
+    for size in args.sizes:
+        for robots in args.robots:
+            for agent_name in args.agents:
+                r = run_config(agent_name, size, robots, args.trials, args.scramble, args.max_moves)
+                rows.append(r)
+                avg_moves = f"{r['avg_moves']:.1f}" if r["avg_moves"] is not None else "N/A"
+                print(f"{agent_name:<8} {f'{size}x{size}':<8} {robots:<8} {100 * r['success']:<10.0f} "
+                      f"{avg_moves:<10} {r['avg_time']:<13.3f} {r['peak_mb']:.1f}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    if args.plot:
+        plot(rows, args.plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+solve_many() against one BFS per start, for many starts sharing a board and goal.
+
+    python -m bench.solve_many --robots 3 --starts 300
+"""
+
+import argparse
+import random
+import time
+
+from agent.backward import solve_many
+from agent.bfs import BFSAgent
+from model.model import RRModel
+from utils.board import generate_rr_board
+from utils.puzzle_generator import make_solved_state, scramble_state
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--robots", type=int, default=3)
+    parser.add_argument("--starts", type=int, default=100)
+    parser.add_argument("--scramble", type=int, default=200)
+    parser.add_argument("--max-nodes", type=int, help="backward search budget (default: per start)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    walls, targets = generate_rr_board()
+    model = RRModel(16, 16, walls, goal_pos=random.choice(targets))
+    solved = make_solved_state(model, model.goal, args.robots)
+    starts = [scramble_state(model, solved, steps=args.scramble) for _ in range(args.starts)]
+
+    stats = {}
+    t0 = time.perf_counter()
+    plans = solve_many(model, starts, max_nodes=args.max_nodes, stats=stats)
+    many_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    reference = [BFSAgent(model, max_nodes=5_000_000)._cached_plan(s) for s in starts]
+    bfs_time = time.perf_counter() - t0
+
+    same = all((p is None) == (r is None) and (p is None or len(p) == len(r))
+               for p, r in zip(plans, reference))
+
+    print(f"\n{args.starts} starts, {args.robots} robots, goal {model.goal}")
+    print(f"backward search: {stats['labelled']} states labelled, levels 0..{stats['depth']} complete, "
+          f"{stats['forward_searches']} forward searches")
+    print(f"{'Method':<16} {'Time (s)':<12} {'Per start (ms)':<16} {'Same lengths'}")
+    print("-" * 60)
+    print(f"{'BFS per start':<16} {bfs_time:<12.3f} {1000 * bfs_time / args.starts:<16.1f} -")
+    print(f"{'solve_many':<16} {many_time:<12.3f} {1000 * many_time / args.starts:<16.1f} "
+          f"{'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Cold-start latency of the entry points, per interpreter.
+
+Each scenario runs in a fresh interpreter process, timed from spawn to exit,
+after one untimed run that fills the bytecode cache (PYTHONDONTWRITEBYTECODE
+is cleared for the children). Reports the median and minimum wall time, and
+the median over a bare interpreter start. Interpreters that are not installed
+are skipped.
+
+    python -m bench.startup
+    python -m bench.startup --interpreters python3 pypy3 --repeats 20 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BOARD = "from utils.board import generate_rr_board; w, t = generate_rr_board({size}, {size})"
+MODEL = BOARD + "; from model.model import RRModel; m = RRModel({size}, {size}, w, goal_pos=None)"
+
+# name -> code run with -c from the repo root
+SCENARIOS = {
+    "interpreter": "pass",
+    "import test.py": "import test",
+    "board (artifact)": BOARD,
+    "board (built)": "from utils.board import build_rr_board; build_rr_board({size}, {size})",
+    "board + model": MODEL,
+    "first agent": MODEL + "; from agent.registry import make_agent; make_agent('bfs', m)",
+    "all agents": "import agent.astar, agent.beam, agent.bfs, agent.iddfs, agent.mcts, "
+                  "agent.portfolio, agent.rl",
+    "service worker": BOARD + "; import service.worker as s; "
+                      "s._warm_model('k', dict(rows={size}, cols={size}, walls=w))",
+}
+
+
+def run_once(interpreter, code, env):
+    t0 = time.perf_counter()
+    subprocess.run([interpreter, "-c", code], cwd=ROOT, env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+
+def measure(interpreter, code, repeats, env):
+    run_once(interpreter, code, env)
+    times = [run_once(interpreter, code, env) for _ in range(repeats)]
+    return {"median": statistics.median(times), "min": min(times), "repeats": repeats}
+
+
+def describe(interpreter, env):
+    out = subprocess.run(
+        [interpreter, "-c", "import platform; print(platform.python_implementation(), platform.python_version())"],
+        env=env, check=True, capture_output=True, text=True,
+    )
+    return out.stdout.strip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interpreters", nargs="+", default=[sys.executable, "pypy3"])
+    parser.add_argument("--only", nargs="+", help="scenarios to run (default: all)")
+    parser.add_argument("--size", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = ROOT
+
+    results = []
+    print(f"{'Interpreter':<20} {'Scenario':<18} {'Median (ms)':<13} {'Min (ms)':<10} {'Over bare (ms)'}",
+          file=sys.stderr)
+    print("-" * 76, file=sys.stderr)
+
+    for interpreter in args.interpreters:
+        path = shutil.which(interpreter)
+        if path is None:
+            print(f"{interpreter:<20} not found, skipped", file=sys.stderr)
+            continue
+        impl = describe(path, env)
+
+        bare = None
+        for name, code in SCENARIOS.items():
+            if args.only and name not in args.only and name != "interpreter":
+                continue
+            stats = measure(path, code.format(size=args.size), args.repeats, env)
+            if name == "interpreter":
+                bare = stats["median"]
+            results.append(dict(interpreter=impl, scenario=name, size=args.size, **stats))
+            print(f"{impl:<20} {name:<18} {1000 * stats['median']:<13.1f} {1000 * stats['min']:<10.1f} "
+                  f"{1000 * (stats['median'] - bare):.1f}", file=sys.stderr)
+
+    report = {
+        "machine": platform.machine(),
+        "repeats": args.repeats,
+        "results": results,
+    }
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+    elif args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
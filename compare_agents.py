@@ -1,8 +1,8 @@
 from agent.bfs import BFSAgent
 from agent.iddfs import IDDFSAgent
 from agent.mcts import MCTSAgent
-from manual_play import generate_rr_board
 from model.model import RRModel
+from utils.board import generate_rr_board
 import time
 from utils.puzzle_generator import generate_solvable_puzzle_2robots
 
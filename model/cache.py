@@ -0,0 +1,206 @@
+import os
+import pickle
+from collections import OrderedDict
+
+
+class SolutionCache:
+    def __init__(self, max_entries=200_000, path=None):
+        """
+        LRU cache of plans keyed by (board, goal, state).
+
+        max_entries : entries kept before the least recently used are evicted
+        path        : optional pickle file; loaded now if it exists, written by save()
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _key(self, model, state):
+        return (model.board_key(), model.goal, state)
+
+    def lookup(self, model, state):
+        """
+        Return (plan, optimal) for state on model's board and goal, or None.
+        Agents only reuse optimal hits: a best-known plan may come from an
+        agent with a weaker guarantee than theirs.
+        """
+        key = self._key(model, state)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        plan, optimal = entry
+        return list(plan), optimal
+
+    def contains(self, model, state):
+        """Membership test that counts as neither hit nor miss."""
+        return self._key(model, state) in self.entries
+
+    def store(self, model, state, plan, optimal=False):
+        """
+        Record a plan from state. Optimal plans also record every suffix, since
+        each intermediate state is then solved optimally too. A best-known plan
+        only replaces a longer best-known plan, never an optimal one.
+        """
+        if plan is None:
+            return
+
+        if not optimal:
+            self._put(self._key(model, state), tuple(plan), False)
+            return
+
+        board, goal = model.board_key(), model.goal
+        for i in range(len(plan) + 1):
+            self._put((board, goal, state), tuple(plan[i:]), True)
+            if i < len(plan):
+                state = model.transition(state, plan[i])
+
+    def _put(self, key, plan, optimal):
+        entry = self.entries.get(key)
+        if entry is not None:
+            old_plan, old_optimal = entry
+            if old_optimal or (not optimal and len(old_plan) <= len(plan)):
+                self.entries.move_to_end(key)
+                return
+
+        self.entries[key] = (plan, optimal)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def rekey(self, old_board, model, changed):
+        """
+        Move entries for old_board onto model's edited board. changed is the
+        list returned by RRModel.add_wall()/remove_wall(); a plan that slides
+        a robot from a changed (cell, direction) is dropped. The rest still
+        reach the goal move for move but lose their optimal flag, since the
+        edit may have opened a shorter route; when no stop changed at all,
+        they keep it.
+        """
+        changed = {(cell, direction) for cell, direction, _, _ in changed}
+        board = model.board_key()
+        moved = [(key, entry) for key, entry in self.entries.items() if key[0] == old_board]
+
+        for key, (plan, optimal) in moved:
+            del self.entries[key]
+            state = key[2]
+            for robot, direction in plan:
+                if (state[robot], direction) in changed:
+                    break
+                state = model.transition(state, (robot, direction))
+            else:
+                self._put((board, key[1], key[2]), plan, optimal and not changed)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    # --------------------------------------------------------
+    # Persistence
+    # --------------------------------------------------------
+    def save(self, path=None):
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path given for SolutionCache.save()")
+
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(list(self.entries.items()), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def load(self, path=None):
+        path = path or self.path
+        with open(path, "rb") as f:
+            items = pickle.load(f)
+
+        for key, (plan, optimal) in items:
+            self._put(key, plan, optimal)
+
+
+class SuccessorCache:
+    def __init__(self, max_entries=100_000):
+        """
+        LRU cache of successor lists and move tables per state, for agents that
+        revisit states (IDDFS iterations, MCTS rollouts). Misses with a known
+        parent derive the move table with RRModel.child_move_table().
+
+        max_entries : states kept before the least recently used are evicted
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.board = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, model, state, parent_state=None, parent_table=None, action=None, evict=True):
+        """
+        Return (successors, move table) for state. Pass the parent state, its
+        move table and the action that led to state to derive misses cheaply.
+        evict=False stores a miss only while the cache has room, for states
+        unlikely to come back (rollout steps) that should not push out others.
+        """
+        if model.board_key() != self.board:
+            # Entries are per board; a wall edit makes them all stale
+            self.entries.clear()
+            self.board = model.board_key()
+
+        entry = self.entries.get(state)
+        if entry is not None:
+            self.entries.move_to_end(state)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        if parent_table is None:
+            table = model.move_table(state)
+        else:
+            table = model.child_move_table(parent_state, parent_table, action, state)
+        # Tuples all the way down: the garbage collector stops tracking them,
+        # so a full cache does not slow every collection
+        entry = (tuple(model.successors_from_table(state, table)), tuple(table))
+
+        if evict or len(self.entries) < self.max_entries:
+            self.entries[state] = entry
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
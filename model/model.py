@@ -9,24 +9,108 @@ DIRS = {
 }
 
 W_UP, W_RIGHT, W_DOWN, W_LEFT = 1, 2, 4, 8
+WALL_BITS = {UP: W_UP, RIGHT: W_RIGHT, DOWN: W_DOWN, LEFT: W_LEFT}
+OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+
+def canonical(state):
+    """
+    Blockers are interchangeable: only the target robot's identity matters, so
+    states that differ by a blocker permutation share this key.
+    """
+    return (state[0],) + tuple(sorted(state[1:]))
+
+
+def canonical_key(cells, bits):
+    """canonical() over cell indices, packed `bits` per cell with the target lowest."""
+    key = cells[0]
+    shift = bits
+    for cell in sorted(cells[1:]):
+        key |= cell << shift
+        shift += bits
+    return key
 
 
 class RRModel:
-    def __init__(self, rows, cols, walls, goal_pos):
+    def __init__(self, rows, cols, walls, goal_pos, cache=None):
         """
         rows, cols : board dimensions
-        walls      : 2D array [rows][cols] of wall bitmasks
+        walls      : 2D array [rows][cols] of wall bitmasks (copied; edit
+                     with add_wall() / remove_wall())
         goal_pos   : (goal_r, goal_c)
+        cache      : optional SolutionCache shared by agents using this model
         """
         self.rows = rows
         self.cols = cols
-        self.walls = walls
+        self.walls = [list(row) for row in walls]
         self.goal = goal_pos
+        self.cache = cache
+        self._board_key = None
+        # Bits per packed cell index; grows past a byte on boards over 16x16
+        self.cell_bits = max(1, (rows * cols - 1).bit_length())
+
+        # _stops[direction][r*cols+c] = where a lone robot on (r,c) stops
+        self._stops = [[None] * (rows * cols) for _ in DIRS]
+        for r in range(rows):
+            self._build_line(LEFT, r)
+            self._build_line(RIGHT, r)
+        for c in range(cols):
+            self._build_line(UP, c)
+            self._build_line(DOWN, c)
+        self._distance_maps = {}
+
+    def board_key(self):
+        """Digest of the board layout, used to key solution caches."""
+        if self._board_key is None:
+            # Only cache users need the digest; keep hashlib out of startup
+            import hashlib
+            h = hashlib.sha1(f"{self.rows}x{self.cols}:".encode())
+            h.update(bytes(m for row in self.walls for m in row))
+            self._board_key = h.hexdigest()
+        return self._board_key
 
     def is_terminal(self, state):
         """Return True if robot has reached the goal."""
         return state[0] == self.goal
 
+    def _blocked(self, r, c, direction):
+        """True if a wall or the board edge stops a move out of (r,c) in direction."""
+        dr, dc = DIRS[direction]
+        nr, nc = r + dr, c + dc
+        if nr < 0 or nr >= self.rows or nc < 0 or nc >= self.cols:
+            return True
+        return bool(self.walls[r][c] & WALL_BITS[direction]
+                    or self.walls[nr][nc] & WALL_BITS[OPPOSITE[direction]])
+
+    def _build_line(self, direction, index):
+        """
+        Recompute the wall-only stops for one direction along row `index`
+        (LEFT/RIGHT) or column `index` (UP/DOWN).
+        Returns [(cell, direction, old_stop, new_stop)] for the stops that changed.
+        """
+        dr, dc = DIRS[direction]
+        if dr == 0:
+            cells = [(index, c) for c in range(self.cols)]
+        else:
+            cells = [(r, index) for r in range(self.rows)]
+        if dr + dc > 0:
+            # Walk from the far end so the neighbour's stop is already known
+            cells.reverse()
+
+        stops = self._stops[direction]
+        cols = self.cols
+        changed = []
+        for r, c in cells:
+            if self._blocked(r, c, direction):
+                stop = (r, c)
+            else:
+                stop = stops[(r + dr) * cols + c + dc]
+            old = stops[r * cols + c]
+            if old != stop:
+                stops[r * cols + c] = stop
+                changed.append(((r, c), direction, old, stop))
+        return changed
+
     def _slide(self, r, c, direction, other_robots=None):
         """
         Slide from (r,c) in the given direction until blocked by:
@@ -35,30 +119,139 @@ class RRModel:
         - another robot (if provided)
         Returns (new_r, new_c)
         """
-        dr, dc = DIRS[direction]
-
-        while True:
-            nr, nc = r + dr, c + dc
-
-            if nr < 0 or nr >= self.rows or nc < 0 or nc >= self.cols:
-                break
-
-            if direction == UP    and (self.walls[r][c] & W_UP): break
-            if direction == RIGHT and (self.walls[r][c] & W_RIGHT): break
-            if direction == DOWN  and (self.walls[r][c] & W_DOWN): break
-            if direction == LEFT  and (self.walls[r][c] & W_LEFT): break
-
-            if direction == DOWN  and (self.walls[nr][nc] & W_UP): break
-            if direction == UP    and (self.walls[nr][nc] & W_DOWN): break
-            if direction == RIGHT and (self.walls[nr][nc] & W_LEFT): break
-            if direction == LEFT  and (self.walls[nr][nc] & W_RIGHT): break
-
-            if other_robots and (nr, nc) in other_robots:
-                break
+        sr, sc = self._stops[direction][r * self.cols + c]
+        if not other_robots:
+            return (sr, sc)
+
+        # Stop short of the nearest robot between (r,c) and the wall stop
+        if direction == UP:
+            for orr, oc in other_robots:
+                if oc == c and sr <= orr < r:
+                    sr = orr + 1
+        elif direction == DOWN:
+            for orr, oc in other_robots:
+                if oc == c and r < orr <= sr:
+                    sr = orr - 1
+        elif direction == LEFT:
+            for orr, oc in other_robots:
+                if orr == r and sc <= oc < c:
+                    sc = oc + 1
+        else:
+            for orr, oc in other_robots:
+                if orr == r and c < oc <= sc:
+                    sc = oc - 1
+
+        return (sr, sc)
+
+    # --------------------------------------------------------
+    # Wall editing
+    # --------------------------------------------------------
+    def add_wall(self, r, c, direction):
+        """
+        Add a wall segment on the `direction` side of (r,c), and on the facing
+        side of its neighbour. Returns the changed stops, see _build_line().
+        """
+        return self._edit_wall(r, c, direction, True)
 
-            r, c = nr, nc
+    def remove_wall(self, r, c, direction):
+        """Remove the wall segment on the `direction` side of (r,c); see add_wall()."""
+        return self._edit_wall(r, c, direction, False)
 
-        return (r, c)
+    def _edit_wall(self, r, c, direction, present):
+        old_key = self.board_key()
+        dr, dc = DIRS[direction]
+        sides = [(r, c, WALL_BITS[direction])]
+        if 0 <= r + dr < self.rows and 0 <= c + dc < self.cols:
+            sides.append((r + dr, c + dc, WALL_BITS[OPPOSITE[direction]]))
+        for wr, wc, bit in sides:
+            if present:
+                self.walls[wr][wc] |= bit
+            else:
+                self.walls[wr][wc] &= ~bit
+
+        # A segment between two cells only affects slides along its own line
+        if dr == 0:
+            lines = [(LEFT, r), (RIGHT, r)]
+        else:
+            lines = [(UP, c), (DOWN, c)]
+        changed = []
+        for line_dir, index in lines:
+            changed.extend(self._build_line(line_dir, index))
+
+        # Any change to the walls changes the digest, even one that moves no stop
+        self._board_key = None
+        if changed:
+            for goal, dist in list(self._distance_maps.items()):
+                if self._distance_map_stale(dist, changed):
+                    del self._distance_maps[goal]
+        if self.cache is not None and self.board_key() != old_key:
+            self.cache.rekey(old_key, self, changed)
+        return changed
+
+    # --------------------------------------------------------
+    # Distance maps
+    # --------------------------------------------------------
+    def distance_map(self, goal=None):
+        """
+        Relaxed number of moves for a robot on each cell (index r*cols+c) to
+        reach goal (default: self.goal). A move may stop on any cell of its
+        wall-only slide, since other robots could block it there, so the map
+        never overestimates: an admissible and consistent heuristic.
+        Unreachable cells get rows*cols. Cached per goal across wall edits
+        that cannot change it.
+        """
+        goal = goal or self.goal
+        dist = self._distance_maps.get(goal)
+        if dist is None:
+            dist = self._build_distance_map(goal)
+            self._distance_maps[goal] = dist
+        return dist
+
+    def _build_distance_map(self, goal):
+        # Relaxed moves are symmetric: x can stop on y iff y can stop on x
+        cols = self.cols
+        unreachable = self.rows * cols
+        dist = [unreachable] * (self.rows * cols)
+        dist[goal[0] * cols + goal[1]] = 0
+        frontier = [goal]
+        d = 0
+        while frontier:
+            d += 1
+            next_frontier = []
+            for r, c in frontier:
+                for direction, (dr, dc) in DIRS.items():
+                    sr, sc = self._stops[direction][r * cols + c]
+                    nr, nc = r, c
+                    while (nr, nc) != (sr, sc):
+                        nr, nc = nr + dr, nc + dc
+                        if dist[nr * cols + nc] == unreachable:
+                            dist[nr * cols + nc] = d
+                            next_frontier.append((nr, nc))
+            frontier = next_frontier
+        return dist
+
+    def _distance_map_stale(self, dist, changed):
+        """
+        A map survives an edit if no removed ray cell was on a shortest path
+        (dist[y] + 1 == dist[x]) and no added ray cell is a shortcut.
+        """
+        cols = self.cols
+        for (r, c), direction, old, new in changed:
+            dr, dc = DIRS[direction]
+            old_len = abs(old[0] - r) + abs(old[1] - c)
+            new_len = abs(new[0] - r) + abs(new[1] - c)
+            here = dist[r * cols + c]
+            for k in range(min(old_len, new_len) + 1, max(old_len, new_len) + 1):
+                there = dist[(r + dr * k) * cols + c + dc * k] + 1
+                if new_len > old_len:
+                    # Added ray cell: stale if it is a shortcut to here
+                    stale = there < here
+                else:
+                    # Removed ray cell: stale if here relied on it
+                    stale = there == here
+                if stale:
+                    return True
+        return False
 
     def transition(self, state, action):
         """
@@ -98,6 +291,96 @@ class RRModel:
                     new_state[i] = new_pos
                     yield tuple(new_state), (i, direction)
 
+    # --------------------------------------------------------
+    # Move tables (delta successors)
+    # --------------------------------------------------------
+    def move_table(self, state):
+        """
+        Destination of every move: table[robot * 4 + direction] = (r, c),
+        the robot's own cell when the move is blocked.
+        """
+        table = []
+        for i, (r, c) in enumerate(state):
+            other_robots = set(state)
+            other_robots.remove((r, c))
+            for direction in (UP, RIGHT, DOWN, LEFT):
+                table.append(self._slide(r, c, direction, other_robots))
+        return table
+
+    def child_move_table(self, state, table, action, next_state):
+        """
+        move_table(next_state), derived from state's table after action. Only
+        the moved robot and robots sharing a row or column with its old or new
+        cell can slide differently, and only along that row or column.
+        """
+        moved, _ = action
+        (orr, oc), (nr, nc) = state[moved], next_state[moved]
+        table = list(table)
+
+        for j, (r, c) in enumerate(next_state):
+            horizontal = j == moved or r == orr or r == nr
+            vertical = j == moved or c == oc or c == nc
+            if not (horizontal or vertical):
+                continue
+
+            other_robots = set(next_state)
+            other_robots.remove((r, c))
+            if vertical:
+                table[j * 4 + UP] = self._slide(r, c, UP, other_robots)
+                table[j * 4 + DOWN] = self._slide(r, c, DOWN, other_robots)
+            if horizontal:
+                table[j * 4 + RIGHT] = self._slide(r, c, RIGHT, other_robots)
+                table[j * 4 + LEFT] = self._slide(r, c, LEFT, other_robots)
+        return table
+
+    def successors_from_table(self, state, table):
+        """successors(state) from its move table, in the same order."""
+        for index, dest in enumerate(table):
+            i, direction = divmod(index, 4)
+            if dest != state[i]:
+                new_state = list(state)
+                new_state[i] = dest
+                yield tuple(new_state), (i, direction)
+
+    def predecessors(self, state):
+        """
+        Yield (prev_state, action) with transition(prev_state, action) == state
+        and prev_state != state: the reverse of successors().
+        """
+        for i, (r, c) in enumerate(state):
+            other_robots = set(state)
+            other_robots.remove((r, c))
+
+            for direction in (UP, RIGHT, DOWN, LEFT):
+                dr, dc = DIRS[direction]
+                # The slide must have ended here: wall, edge or robot ahead
+                if not (self._blocked(r, c, direction) or (r + dr, c + dc) in other_robots):
+                    continue
+
+                # ... and started anywhere behind, up to a wall or robot
+                br, bc = self._slide(r, c, OPPOSITE[direction], other_robots)
+                pr, pc = r, c
+                while (pr, pc) != (br, bc):
+                    pr, pc = pr - dr, pc - dc
+                    prev_state = list(state)
+                    prev_state[i] = (pr, pc)
+                    yield tuple(prev_state), (i, direction)
+
+    def pack_state(self, state):
+        """Pack a state into one int, cell index r*cols+c per robot, robot 0 lowest."""
+        bits, cols = self.cell_bits, self.cols
+        packed = 0
+        for i, (r, c) in enumerate(state):
+            packed |= (r * cols + c) << (bits * i)
+        return packed
+
+    def unpack_state(self, packed, num_robots):
+        bits, cols = self.cell_bits, self.cols
+        mask = (1 << bits) - 1
+        return tuple(
+            divmod((packed >> (bits * i)) & mask, cols) for i in range(num_robots)
+        )
+
     def get_states(self, num_robots):
         """
         Return a list of all possible valid game states
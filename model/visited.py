@@ -0,0 +1,60 @@
+from math import comb
+
+
+class StateIndex:
+    def __init__(self, num_cells, num_robots):
+        """
+        Dense ranking of states with blocker symmetry: the target robot's cell
+        times the combinatorial rank of the (unordered) blocker cells.
+
+        num_cells  : rows * cols
+        num_robots : robots per state, target first
+        """
+        self.num_cells = num_cells
+        self.num_robots = num_robots
+        k = num_robots - 1
+        # binom[j][n] = C(n, j + 1), for ranking sorted blocker cells
+        self.binom = [[comb(n, j + 1) for n in range(num_cells)] for j in range(k)]
+        self.blocker_space = comb(num_cells, k)
+        self.size = num_cells * self.blocker_space
+
+    def rank(self, cells):
+        """cells: target cell index followed by blocker cell indices."""
+        r = 0
+        binom = self.binom
+        for j, b in enumerate(sorted(cells[1:])):
+            r += binom[j][b]
+        return cells[0] * self.blocker_space + r
+
+
+class BitsetVisited:
+    def __init__(self, size, max_bytes=1 << 30):
+        """
+        One bit per ranked state.
+        Raises MemoryError if the bitset would exceed max_bytes.
+        """
+        nbytes = (size + 7) >> 3
+        if nbytes > max_bytes:
+            raise MemoryError(
+                f"Bitset for {size} states needs {nbytes} bytes (limit {max_bytes})")
+        self.bits = bytearray(nbytes)
+        self.count = 0
+
+    def __contains__(self, i):
+        return self.bits[i >> 3] >> (i & 7) & 1
+
+    def add(self, i):
+        """Set bit i; return True if it was newly set."""
+        byte = i >> 3
+        mask = 1 << (i & 7)
+        if self.bits[byte] & mask:
+            return False
+        self.bits[byte] |= mask
+        self.count += 1
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def nbytes(self):
+        return len(self.bits)
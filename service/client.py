@@ -0,0 +1,104 @@
+"""
+Minimal asyncio client for the solve service.
+
+    python -m service.client --socket /tmp/rr.sock --robots 3 --agent bfs
+"""
+
+import argparse
+import asyncio
+import itertools
+
+from service import protocol
+
+
+class SolveClient:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count(1)
+        self.waiting = {}
+        self.receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, socket_path=None, host="127.0.0.1", port=protocol.DEFAULT_PORT):
+        if socket_path:
+            reader, writer = await asyncio.open_unix_connection(socket_path, limit=protocol.MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=protocol.MAX_LINE)
+        return cls(reader, writer)
+
+    async def solve(self, board, goal, state, agent="bfs", budget=None, cache=False):
+        """
+        Send one request and wait for its response.
+        Many solve() calls may be in flight on the same connection.
+        cache : let the worker answer from, and add to, its shared solution cache
+        """
+        req_id = next(self.ids)
+        fut = asyncio.get_running_loop().create_future()
+        self.waiting[req_id] = fut
+
+        self.writer.write(protocol.encode(
+            protocol.make_request(req_id, board, goal, state, agent, budget, cache)))
+        await self.writer.drain()
+        return await fut
+
+    async def _receive(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                msg = protocol.parse_response(line)
+                fut = self.waiting.pop(msg.get("id"), None)
+                if fut is not None and not fut.done():
+                    fut.set_result(msg)
+        finally:
+            for fut in self.waiting.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError("server closed the connection"))
+            self.waiting.clear()
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.receiver.cancel()
+
+
+async def _solve_random(args):
+    from model.model import RRModel
+    from utils.board import generate_rr_board
+    from utils.puzzle_generator import generate_solvable_puzzle
+
+    walls, targets = generate_rr_board()
+    model = RRModel(16, 16, walls, goal_pos=None)
+    start, goal = generate_solvable_puzzle(model, targets, args.robots, args.scramble)
+
+    client = await SolveClient.connect(args.socket, args.host, args.port)
+    try:
+        reply = await client.solve(
+            protocol.encode_board(16, 16, walls), goal, start, args.agent,
+            {"max_moves": args.max_moves})
+    finally:
+        await client.close()
+
+    print(f"Start: {start}")
+    print(f"Goal : {goal}")
+    print(reply)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send one random puzzle to the solve service")
+    parser.add_argument("--socket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=protocol.DEFAULT_PORT)
+    parser.add_argument("--robots", type=int, default=2)
+    parser.add_argument("--agent", default="bfs")
+    parser.add_argument("--scramble", type=int, default=40)
+    parser.add_argument("--max-moves", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    asyncio.run(_solve_random(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Local load generator for the solve service.
+
+Generates puzzles on a handful of boards, keeps `concurrency` requests in
+flight, and reports latency percentiles and throughput.
+
+    python -m service.loadgen --spawn --requests 500 --concurrency 32
+    python -m service.loadgen --socket /tmp/rr.sock --robots 3 --agent iddfs
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from service import protocol
+from service.client import SolveClient
+from service.server import SolveServer
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return float("nan")
+    k = (len(sorted_values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def make_workload(num_requests, robots, boards, scramble_steps):
+    from model.model import RRModel
+    from utils.board import generate_rr_board
+    from utils.puzzle_generator import generate_solvable_puzzle
+
+    walls, targets = generate_rr_board()
+    board_list = []
+    for b in range(boards):
+        # Alternate mirrored layouts so each board gets its own key and warm model
+        if b % 2:
+            board_list.append((_mirror_walls(walls), [(r, 15 - c) for r, c in targets]))
+        else:
+            board_list.append((walls, targets))
+
+    workload = []
+    for _ in range(num_requests):
+        variant, variant_targets = random.choice(board_list)
+        model = RRModel(16, 16, variant, goal_pos=None)
+        start, goal = generate_solvable_puzzle(model, variant_targets, robots, scramble_steps)
+        workload.append((protocol.encode_board(16, 16, variant), goal, start))
+    return workload
+
+
+def _mirror_walls(walls):
+    from model.model import W_UP, W_RIGHT, W_DOWN, W_LEFT
+
+    def flip(mask):
+        out = mask & (W_UP | W_DOWN)
+        if mask & W_LEFT:
+            out |= W_RIGHT
+        if mask & W_RIGHT:
+            out |= W_LEFT
+        return out
+
+    return [[flip(m) for m in reversed(row)] for row in walls]
+
+
+async def run_load(args):
+    server = None
+    socket_path = args.socket
+    if args.spawn:
+        server = SolveServer(workers=args.workers, max_pending=args.max_pending)
+        await server.start(socket_path=socket_path, host=args.host, port=0)
+        port = None if socket_path else server.address()[1]
+    else:
+        port = args.port
+
+    workload = make_workload(args.requests, args.robots, args.boards, args.scramble)
+    budget = {"max_moves": args.max_moves}
+    budget.update(dict(kv.split("=", 1) for kv in args.budget))
+    budget = {k: _budget_value(v) for k, v in budget.items()}
+
+    client = await SolveClient.connect(socket_path, args.host, port)
+    latencies = []
+    failures = 0
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def one(board, goal, start):
+        nonlocal failures
+        async with sem:
+            t0 = time.perf_counter()
+            reply = await client.solve(board, goal, start, args.agent, budget, args.cache)
+            latencies.append(time.perf_counter() - t0)
+            if not reply.get("ok") or reply.get("plan") is None:
+                failures += 1
+
+    t_start = time.perf_counter()
+    await asyncio.gather(*(one(*job) for job in workload))
+    elapsed = time.perf_counter() - t_start
+
+    await client.close()
+    if server is not None:
+        await server.close()
+
+    latencies.sort()
+    print(f"\n{'Requests':<12} {'Failed':<8} {'Elapsed (s)':<12} {'Req/s':<10} "
+          f"{'p50 (ms)':<10} {'p99 (ms)':<10}")
+    print("-" * 70)
+    print(f"{len(latencies):<12} {failures:<8} {elapsed:<12.3f} {len(latencies) / elapsed:<10.1f} "
+          f"{1000 * percentile(latencies, 50):<10.1f} {1000 * percentile(latencies, 99):<10.1f}")
+
+
+def _budget_value(value):
+    """Numbers and true/false from KEY=VALUE; anything else (mode=prioritized) as given."""
+    if not isinstance(value, str):
+        return value
+    if value in ("true", "false"):
+        return value == "true"
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for the solve service")
+    parser.add_argument("--spawn", action="store_true", help="run a server in this process")
+    parser.add_argument("--socket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=protocol.DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-pending", type=int, default=256)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--robots", type=int, default=2)
+    parser.add_argument("--boards", type=int, default=2)
+    parser.add_argument("--agent", default="bfs")
+    parser.add_argument("--budget", nargs="*", default=[], metavar="KEY=VALUE",
+                        help="agent keyword arguments, e.g. max_nodes=50000")
+    parser.add_argument("--cache", action="store_true",
+                        help="let workers reuse optimal plans across requests")
+    parser.add_argument("--scramble", type=int, default=40)
+    parser.add_argument("--max-moves", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    asyncio.run(run_load(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Line-delimited JSON protocol shared by the solve server and client.
+
+Request (one JSON object per line):
+    {"id": 1,
+     "board": {"rows": 16, "cols": 16, "walls": [[...], ...]},
+     "goal": [r, c],
+     "state": [[r, c], ...],          # target robot first
+     "agent": "bfs",
+     "budget": {"max_nodes": 100000, "max_moves": 50},
+     "cache": false}                  # optional: reuse optimal plans across requests
+
+Response:
+    {"id": 1, "ok": true, "plan": [[robot, direction], ...], "moves": 7, "solve_time": 0.012}
+    {"id": 1, "ok": false, "error": "..."}
+"""
+
+import hashlib
+import json
+
+DEFAULT_PORT = 8765
+MAX_LINE = 1 << 20
+
+# Budget keys a request may set; everything else (storage, scratch_dir, ...)
+# stays under the server's control
+BUDGET_KEYS = {
+    "max_moves", "max_nodes", "max_depth", "prune",
+    "time", "rollout_depth",
+    "weight", "beam_width",
+    "discount", "num_iterations", "mode",
+}
+
+
+def encode_board(rows, cols, walls):
+    return {"rows": rows, "cols": cols, "walls": [list(row) for row in walls]}
+
+
+def board_key(board):
+    """Stable identifier for a board payload, used to group requests and warm models."""
+    raw = json.dumps([board["rows"], board["cols"], board["walls"]], separators=(",", ":"))
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def make_request(req_id, board, goal, state, agent="bfs", budget=None, cache=False):
+    return {
+        "id": req_id,
+        "board": board,
+        "goal": list(goal),
+        "state": [list(pos) for pos in state],
+        "agent": agent,
+        "budget": budget or {},
+        "cache": cache,
+    }
+
+
+def decode_request(line):
+    """
+    Decode one request line into a dict, without validating its fields, so a
+    bad request can still be answered under its id.
+    Raises ValueError if the line is not a JSON object.
+    """
+    try:
+        req = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e}")
+
+    if not isinstance(req, dict):
+        raise ValueError("request must be a JSON object")
+    return req
+
+
+def check_request(req):
+    """
+    Validate a decoded request and fill in defaults.
+    Raises ValueError on malformed input.
+    """
+    for field in ("board", "goal", "state"):
+        if field not in req:
+            raise ValueError(f"missing field {field!r}")
+
+    board = req["board"]
+    if not isinstance(board, dict) or not {"rows", "cols", "walls"} <= board.keys():
+        raise ValueError("board must have rows, cols and walls")
+    if not isinstance(req.setdefault("budget", {}), dict):
+        raise ValueError("budget must be an object")
+    if not isinstance(req.setdefault("cache", False), bool):
+        raise ValueError("cache must be true or false")
+
+    req.setdefault("agent", "bfs")
+    return req
+
+
+def check_budget(budget):
+    """
+    Raise ValueError for budget keys outside BUDGET_KEYS. Checked per job by
+    the worker, so the error reaches the client under the request's id.
+    """
+    unknown = sorted(set(budget) - BUDGET_KEYS)
+    if unknown:
+        raise ValueError(f"unsupported budget keys: {', '.join(unknown)}")
+
+
+def parse_response(line):
+    return json.loads(line)
+
+
+def encode(msg):
+    return (json.dumps(msg, separators=(",", ":")) + "\n").encode()
+
+
+def decode_state(state):
+    return tuple(tuple(pos) for pos in state)
+
+
+def decode_plan(plan):
+    return None if plan is None else [tuple(a) for a in plan]
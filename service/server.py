@@ -0,0 +1,199 @@
+"""
+Local asyncio solve service.
+
+Clients send line-delimited JSON requests (see service/protocol.py) over a
+unix socket or a localhost TCP port. Requests are queued, grouped by board,
+and solved in a process pool whose workers (service/worker.py) keep warm
+RRModel instances.
+
+    python -m service.server --socket /tmp/rr.sock
+    python -m service.server --port 8765 --workers 4
+"""
+
+import argparse
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from service import protocol
+from service.worker import solve_batch
+
+# ============================================================
+# Server side
+# ============================================================
+
+class SolveServer:
+    def __init__(self, workers=None, max_pending=256, batch_size=32, batch_wait=0.002):
+        """
+        workers     : process pool size (default: CPU count)
+        max_pending : queued requests before readers stop consuming input
+        batch_size  : max requests handed to one worker call
+        batch_wait  : seconds to wait for more requests before dispatching a batch
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        # Only a couple of batches per worker in flight; once they are busy the
+        # queue fills and connection readers block on put().
+        self.inflight = asyncio.Semaphore(2 * self.workers)
+        self.pool = None
+        self.server = None
+        self.dispatcher = None
+        # Running _run_group tasks; the event loop only keeps weak references
+        self.tasks = set()
+        self.stats = {"requests": 0, "batches": 0, "errors": 0}
+
+    async def start(self, socket_path=None, host="127.0.0.1", port=protocol.DEFAULT_PORT):
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.dispatcher = asyncio.create_task(self._dispatch())
+
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            self.server = await asyncio.start_unix_server(
+                self._handle, path=socket_path, limit=protocol.MAX_LINE)
+        else:
+            self.server = await asyncio.start_server(
+                self._handle, host=host, port=port, limit=protocol.MAX_LINE)
+        return self.server
+
+    def address(self):
+        return self.server.sockets[0].getsockname()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.dispatcher.cancel()
+        self.pool.shutdown(cancel_futures=True)
+
+    async def _handle(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        pending = set()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                req = None
+                try:
+                    req = protocol.decode_request(line)
+                    protocol.check_request(req)
+                except ValueError as e:
+                    # Answer under the request's id when it has one, or the
+                    # client would wait for a reply that never comes
+                    self.stats["errors"] += 1
+                    req_id = None if req is None else req.get("id")
+                    writer.write(protocol.encode({"id": req_id, "ok": False, "error": str(e)}))
+                    continue
+
+                fut = loop.create_future()
+                # Blocks while the queue is full, which stops reading from this
+                # connection and pushes back on the client.
+                await self.queue.put((protocol.board_key(req["board"]), req, fut))
+                self.stats["requests"] += 1
+
+                task = asyncio.create_task(self._reply(req.get("id"), fut, writer))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            if pending:
+                await asyncio.gather(*pending)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # Client went away, or the server is shutting down under us
+            pass
+        finally:
+            writer.close()
+
+    async def _reply(self, req_id, fut, writer):
+        result = await fut
+        writer.write(protocol.encode({"id": req_id, **result}))
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_wait
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups = {}
+            for key, req, fut in batch:
+                groups.setdefault(key, []).append((req, fut))
+
+            for key, items in groups.items():
+                await self.inflight.acquire()
+                task = asyncio.create_task(self._run_group(key, items))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+
+    async def _run_group(self, key, items):
+        loop = asyncio.get_running_loop()
+        board = items[0][0]["board"]
+        jobs = [
+            (req["goal"], req["state"], req["agent"], req["budget"], req["cache"])
+            for req, _ in items
+        ]
+        self.stats["batches"] += 1
+
+        try:
+            results = await loop.run_in_executor(self.pool, solve_batch, key, board, jobs)
+        except Exception as e:
+            results = [{"ok": False, "error": f"{type(e).__name__}: {e}"}] * len(items)
+        finally:
+            self.inflight.release()
+
+        for (_, fut), result in zip(items, results):
+            if not fut.done():
+                fut.set_result(result)
+
+
+async def serve(args):
+    server = SolveServer(
+        workers=args.workers,
+        max_pending=args.max_pending,
+        batch_size=args.batch_size,
+        batch_wait=args.batch_wait,
+    )
+    await server.start(socket_path=args.socket, host=args.host, port=args.port)
+    print(f"Serving on {server.address()} with {server.workers} workers")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ricochet Robots solve service")
+    parser.add_argument("--socket", help="unix socket path (default: TCP)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=protocol.DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-pending", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--batch-wait", type=float, default=0.002)
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
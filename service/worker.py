@@ -0,0 +1,72 @@
+"""
+Worker side of the solve service: runs inside the server's process pool.
+
+Kept apart from service.server so spawned workers import only this module,
+the protocol and the model, not asyncio and the server machinery. Agents are
+imported on first use through the registry.
+"""
+
+import time
+from collections import OrderedDict
+
+from service import protocol
+
+
+_MODELS = OrderedDict()
+_MAX_MODELS = 8
+_CACHE = None
+
+
+def _warm_model(key, board):
+    from model.cache import SolutionCache
+    from model.model import RRModel
+
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = SolutionCache()
+
+    model = _MODELS.get(key)
+    if model is None:
+        model = RRModel(board["rows"], board["cols"], board["walls"], goal_pos=None)
+        _MODELS[key] = model
+        if len(_MODELS) > _MAX_MODELS:
+            _MODELS.popitem(last=False)
+    else:
+        _MODELS.move_to_end(key)
+    return model
+
+
+def solve_batch(key, board, jobs):
+    """
+    Solve every job for one board with a single warm model.
+    jobs: list of (goal, state, agent_name, budget, use_cache)
+    Only jobs with use_cache share the worker's SolutionCache.
+    Returns a list of result dicts in the same order.
+    """
+    from agent.registry import make_agent
+
+    model = _warm_model(key, board)
+    results = []
+
+    for goal, state, agent_name, budget, use_cache in jobs:
+        budget = dict(budget)
+        max_moves = budget.pop("max_moves", 50)
+        start = time.perf_counter()
+        try:
+            protocol.check_budget(budget)
+            model.goal = tuple(goal)
+            model.cache = _CACHE if use_cache else None
+            agent = make_agent(agent_name, model, num_robots=len(state), **budget)
+            plan = agent.solve(protocol.decode_state(state), max_moves=max_moves)
+        except Exception as e:
+            results.append({"ok": False, "error": f"{type(e).__name__}: {e}"})
+            continue
+
+        results.append({
+            "ok": True,
+            "plan": None if plan is None else [list(a) for a in plan],
+            "moves": None if plan is None else len(plan),
+            "solve_time": time.perf_counter() - start,
+        })
+
+    return results
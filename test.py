@@ -19,7 +19,11 @@ Algorithms Compared:
 - BFS (Breadth-First Search): Optimal but exhaustive search.
 - IDDFS (Iterative Deepening DFS): Depth-limited exhaustive search.
 - MCTS (Monte Carlo Tree Search): Online stochastic planning with rollouts.
-- Value Iteration: Tabular dynamic programming (only feasible for 2 robots).
+- Value Iteration: Tabular dynamic programming; full sweeps for 2 robots,
+  prioritized sweeping over reachable states for 3.
+- Weighted A*: Best-first search on a relaxed goal-distance heuristic; at most
+  `weight` times the optimal plan length.
+- Beam Search: Keeps the states closest to the goal at each depth; fast, no guarantee.
 
 What This Script Does:
 This script generates solvable Ricochet Robots puzzles with 2, 3, and 4 robots
@@ -80,22 +84,28 @@ MCTS       91         14.0         6.986
 VIter      0%         N/A          N/A
 """
 
-from agent.bfs import BFSAgent
-from agent.iddfs import IDDFSAgent
-from agent.mcts import MCTSAgent
-
-from agent.rl import ValueIterationAgent
-from manual_play import generate_rr_board
+from agent.registry import make_agent
 from model.model import RRModel
-
-from utils.puzzle_generator import (
-    generate_solvable_puzzle_2robots,
-    generate_solvable_puzzle_3robots,
-    generate_solvable_puzzle_4robots,
+from utils.board import generate_rr_board
+from utils.puzzle_generator import generate_solvable_puzzle
+from utils.results import (
+    ResultLog,
+    aggregate,
+    print_aggregate_results,
+    print_portfolio_summary,
+    trial_seed,
 )
 
+import argparse
+import contextlib
+import os
+import random
 import time
-import sys
+
+AGENT_NAMES = ["BFS", "IDDFS", "MCTS", "VIter", "WAStar", "Beam"]
+# Opt-in (--portfolio): each race spawns a process per member and may wait
+# out a 10 s deadline
+PORTFOLIO = "Portfolio"
 
 
 def test_agent(agent, model, start_state, agent_name, max_moves=50):
@@ -125,25 +135,41 @@ def test_agent(agent, model, start_state, agent_name, max_moves=50):
     }
 
 
+def agent_specs(robot_count, board_size, max_moves):
+    """
+    (name, registry key, constructor kwargs) for each compared agent. Agents
+    are built, and their modules imported, only when they are about to run.
+    """
+    return [
+        ("BFS", "bfs", {"max_nodes": 100_000}),
+        ("IDDFS", "iddfs", {"max_depth": 100, "max_nodes": 100_000}),
+        ("MCTS", "mcts", {"time": 0.5, "rollout_depth": 100, "max_nodes": 100_000}),
+        ("VIter", "viter", {"discount": 0.9, "num_iterations": 20,
+                            "mode": "sweep" if robot_count <= 2 and board_size <= 16 else "prioritized"}),
+        ("Portfolio", "portfolio", {"deadline": 10.0, "max_moves": max_moves}),
+        ("WAStar", "astar", {"weight": 2.0, "max_nodes": 100_000}),
+        ("Beam", "beam", {"beam_width": 500, "max_nodes": 200_000}),
+    ]
+
+
 def generate_puzzle(model, targets, robot_count, scramble_steps):
-    if robot_count == 2:
-        return generate_solvable_puzzle_2robots(model, targets, scramble_steps)
-    elif robot_count == 3:
-        return generate_solvable_puzzle_3robots(model, targets, scramble_steps)
-    elif robot_count == 4:
-        return generate_solvable_puzzle_4robots(model, targets, scramble_steps)
-    else:
-        raise ValueError("Robot count must be 2, 3, or 4")
+    if robot_count < 1:
+        raise ValueError("Robot count must be at least 1")
+    return generate_solvable_puzzle(model, targets, robot_count, scramble_steps)
 
 
-def compare_agents_for_robot_count(robot_count, scramble_steps=40, max_moves=50):
+def compare_agents_for_robot_count(robot_count, scramble_steps=40, max_moves=50, caches=None,
+                                   board_size=16, trial=None, seed=None, log=None, profiler=None,
+                                   agents=AGENT_NAMES):
     print("\n" + "=" * 80)
-    print(f"COMPARISON — {robot_count} ROBOTS")
+    print(f"COMPARISON — {robot_count} ROBOTS — {board_size}x{board_size}")
     print("=" * 80)
 
-    walls, targets = generate_rr_board()
-    model = RRModel(16, 16, walls, goal_pos=None)
+    walls, targets = generate_rr_board(board_size, board_size)
+    model = RRModel(board_size, board_size, walls, goal_pos=None)
 
+    if seed is not None:
+        random.seed(seed)
     start, goal = generate_puzzle(model, targets, robot_count, scramble_steps)
     model.goal = goal
 
@@ -151,20 +177,30 @@ def compare_agents_for_robot_count(robot_count, scramble_steps=40, max_moves=50)
     print(f"Goal : {goal}")
     print(model.render(start))
 
-    agents = [
-        (BFSAgent(model, max_nodes=100_000), "BFS"),
-        (IDDFSAgent(model, max_depth=100, max_nodes=100_000), "IDDFS"),
-        (MCTSAgent(model, time=0.5, rollout_depth=100), "MCTS"),
-        (ValueIterationAgent(model, num_robots=robot_count, discount=0.9, num_iterations=20), "VIter"),
-    ]
-
     results = []
-    for agent, name in agents:
-        if name == "VIter" and robot_count > 2:
+    for name, key, kwargs in agent_specs(robot_count, board_size, max_moves):
+        if name not in agents:
+            continue
+        if name == "VIter" and robot_count > 3:
             print(f"\nSkipping {name} for {robot_count} robots (not supported).")
             continue
+        recorded = log.recorded(trial, robot_count, name) if log is not None else None
+        if recorded is not None:
+            print(f"\nSkipping {name} (already recorded).")
+            results.append(recorded)
+            continue
+
+        # Each agent only sees its own cached plans, so its moves and times
+        # never come from another agent's search
+        model.cache = caches.get(name) if caches else None
+        agent = make_agent(key, model, num_robots=robot_count, **kwargs)
         print(f"\nTesting {name}...")
-        result = test_agent(agent, model, start, name, max_moves)
+        with profiler.run(name) if profiler else contextlib.nullcontext({}) as profile:
+            result = test_agent(agent, model, start, name, max_moves)
+        result.update(
+            trial=trial, seed=seed, robots=robot_count, board_size=board_size,
+            start=start, goal=goal, counters=dict(getattr(agent, "stats", None) or {}, **profile),
+        )
         results.append(result)
 
         if result["success"]:
@@ -172,15 +208,39 @@ def compare_agents_for_robot_count(robot_count, scramble_steps=40, max_moves=50)
         else:
             print(f"  ✗ Failed in {result['time']:.3f}s")
 
+        counters = result["counters"]
+        if "peak_nodes" in counters:
+            size = counters["bytes_per_node"]
+            size_str = f"{size} bytes/node" if size is not None else "bytes/node n/a"
+            print(f"  tree: {counters['peak_nodes']} peak nodes, "
+                  f"{size_str}, {counters['pruned_nodes']} pruned")
+
+        succ = counters.get("successor_cache")
+        if succ:
+            print(f"  successor cache: {100 * succ['hit_rate']:.0f}% hits, {succ['entries']} entries")
+
+        if name == PORTFOLIO and agent.history:
+            result["counters"]["portfolio"] = agent.history
+            race = agent.history[0]
+            print(f"  won by {race['winner'] or 'nobody'} in {race['race_time']:.3f}s"
+                  f"{' (optimal)' if race['optimal'] else ''}")
+
+        if log is not None:
+            log.write(result)
+
     return results
 
 
-def compare_all_agents(robot_counts=(2, 3, 4), scramble_steps=1000, max_moves=50):
+def compare_all_agents(robot_counts=(2, 3, 4), scramble_steps=1000, max_moves=50, caches=None,
+                       board_size=16, trial=None, log=None, profiler=None, agents=AGENT_NAMES):
     all_results = {}
 
     for rc in robot_counts:
+        seed = trial_seed(log.base_seed, trial, rc) if log is not None else None
         results = compare_agents_for_robot_count(
-            rc, scramble_steps=scramble_steps, max_moves=max_moves
+            rc, scramble_steps=scramble_steps, max_moves=max_moves, caches=caches,
+            board_size=board_size, trial=trial, seed=seed, log=log, profiler=profiler,
+            agents=agents
         )
         all_results[rc] = results
 
@@ -199,53 +259,106 @@ def compare_all_agents(robot_counts=(2, 3, 4), scramble_steps=1000, max_moves=50
     return all_results
 
 
-def run_multiple_tests(num_tests=5, robot_counts=(2, 3, 4), scramble_steps=1000):
-    stats = {}
-
-    for rc in robot_counts:
-        stats[rc] = {
-            "BFS": {"success": 0, "moves": [], "time": []},
-            "IDDFS": {"success": 0, "moves": [], "time": []},
-            "MCTS": {"success": 0, "moves": [], "time": []},
-            "VIter": {"success": 0, "moves": [], "time": []},
-        }
+def run_multiple_tests(num_tests=5, robot_counts=(2, 3, 4), scramble_steps=1000, caches=None,
+                       board_size=16, log=None, profiler=None, agents=AGENT_NAMES):
+    records = []
 
     for i in range(num_tests):
         print(f"\n### Trial {i+1}/{num_tests} ###")
         results = compare_all_agents(
             robot_counts=robot_counts,
-            scramble_steps=scramble_steps
+            scramble_steps=scramble_steps,
+            caches=caches,
+            board_size=board_size,
+            trial=i,
+            log=log,
+            profiler=profiler,
+            agents=agents
         )
 
-        for rc, agent_results in results.items():
-            for r in agent_results:
-                agent = r["agent"]
-                if r["success"]:
-                    stats[rc][agent]["success"] += 1
-                    stats[rc][agent]["moves"].append(r["moves"])
-                    stats[rc][agent]["time"].append(r["time"])
-
-    print("\n" + "=" * 80)
-    print("AGGREGATE RESULTS")
-    print("=" * 80)
+        for agent_results in results.values():
+            records.extend(agent_results)
 
+    stats = aggregate(records)
+    empty = {"runs": num_tests, "success": 0, "moves": [], "time": []}
     for rc in robot_counts:
-        print(f"\n--- {rc} ROBOTS ---")
-        print(f"{'Agent':<10} {'Success %':<10} {'Avg Moves':<12} {'Avg Time (s)'}")
-        print("-" * 60)
+        stats[rc] = {name: stats.get(rc, {}).get(name, empty) for name in agents}
+    print_aggregate_results(stats, robot_counts)
+
+    races = [race for r in records for race in r.get("counters", {}).get("portfolio", [])]
+    if races:
+        print_portfolio_summary(races)
+
 
-        for agent, data in stats[rc].items():
-            if data["moves"]:
-                success_rate = 100 * data["success"] / num_tests
-                avg_moves = sum(data["moves"]) / len(data["moves"])
-                avg_time = sum(data["time"]) / len(data["time"])
-                print(f"{agent:<10} {success_rate:<10.0f} {avg_moves:<12.1f} {avg_time:<.3f}")
-            else:
-                print(f"{agent:<10} 0%         N/A          N/A")
+def cache_path(path, agent_name):
+    """cache.pkl -> cache.BFS.pkl: one solution cache file per agent."""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{agent_name}{ext}"
+
+
+def print_cache_stats(name, cache):
+    stats = cache.stats()
+    print(f"{name:<10} {stats['entries']} entries, {stats['hits']} hits, "
+          f"{stats['misses']} misses ({100 * stats['hit_rate']:.0f}% hit rate), "
+          f"{stats['evictions']} evictions")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        run_multiple_tests(num_tests=int(sys.argv[1]))
-    else:
-        compare_all_agents()
+    parser = argparse.ArgumentParser(description="Compare Ricochet Robots agents")
+    parser.add_argument("runs", type=int, nargs="?", help="number of trials (default: single comparison)")
+    parser.add_argument("--robots", type=int, nargs="+", default=[2, 3, 4],
+                        help="robot counts to compare (default: 2 3 4)")
+    parser.add_argument("--size", type=int, default=16, help="board is SIZE x SIZE (default: 16)")
+    parser.add_argument("--portfolio", action="store_true",
+                        help="also race the Portfolio agent (a process per member per puzzle)")
+    parser.add_argument("--cache", metavar="PATH",
+                        help="keep a solution cache per agent across trials, persisted "
+                             "to PATH with the agent name inserted (cache.pkl -> cache.BFS.pkl)")
+    parser.add_argument("--cache-size", type=int, default=200_000)
+    parser.add_argument("--results", metavar="PATH",
+                        help="append each trial result to a JSONL file as soon as it finishes")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip trials already recorded in --results")
+    parser.add_argument("--seed", type=int, help="campaign seed (default: random, or the one in --results)")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="run agents under cProfile and tracemalloc, writing DIR/<agent>.prof "
+                             "(timings include profiling overhead)")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="with --profile, skip tracemalloc peak tracking")
+    args = parser.parse_args()
+
+    if args.resume and not args.results:
+        parser.error("--resume needs --results")
+
+    # Only pay for these imports when the options are used
+    if args.cache:
+        from model.cache import SolutionCache
+    if args.profile:
+        from utils.profiling import AgentProfiler
+
+    log = ResultLog(args.results, resume=args.resume, base_seed=args.seed) if args.results else None
+    profiler = AgentProfiler(args.profile, memory=not args.no_memory) if args.profile else None
+    agents = AGENT_NAMES + [PORTFOLIO] if args.portfolio else AGENT_NAMES
+    caches = {
+        name: SolutionCache(args.cache_size, path=cache_path(args.cache, name)) for name in agents
+    } if args.cache else None
+
+    try:
+        if args.runs:
+            run_multiple_tests(num_tests=args.runs, robot_counts=args.robots, caches=caches,
+                               board_size=args.size, log=log, profiler=profiler, agents=agents)
+        else:
+            compare_all_agents(robot_counts=args.robots, caches=caches, board_size=args.size,
+                               trial=0, log=log, profiler=profiler, agents=agents)
+    finally:
+        if log is not None:
+            log.close()
+        if profiler is not None:
+            profiler.save()
+            profiler.print_summary()
+
+    if caches is not None:
+        print("\nSolution caches:")
+        for name, cache in caches.items():
+            print_cache_stats(name, cache)
+            cache.save()
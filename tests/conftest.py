@@ -0,0 +1,22 @@
+import random
+
+import pytest
+
+from model.model import RRModel
+from utils.board import generate_rr_board
+from utils.puzzle_generator import generate_solvable_puzzle
+
+
+def _make_puzzle(robots, seed):
+    """A random 16x16 board with a solvable (start, goal) for `robots` robots."""
+    random.seed(seed)
+    walls, targets = generate_rr_board()
+    model = RRModel(16, 16, walls, goal_pos=None)
+    start, goal = generate_solvable_puzzle(model, targets, robots, 200)
+    model.goal = goal
+    return model, start
+
+
+@pytest.fixture
+def make_puzzle():
+    return _make_puzzle
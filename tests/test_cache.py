@@ -0,0 +1,122 @@
+"""
+SolutionCache and SuccessorCache entries must follow the board through
+RRModel.add_wall() / remove_wall().
+"""
+
+from agent.bfs import BFSAgent
+from model.cache import SolutionCache, SuccessorCache
+from model.model import UP, WALL_BITS
+
+
+def solved_model(make_puzzle, seed):
+    model, start = make_puzzle(3, seed)
+    model.cache = SolutionCache()
+    plan = BFSAgent(model, max_nodes=1_000_000)._cached_plan(start)
+    assert plan is not None
+    return model, start, plan
+
+
+def check_entries(model):
+    """Every entry is keyed to the current board and its plan still reaches the goal."""
+    board = model.board_key()
+    for (key_board, goal, start), (plan, optimal) in model.cache.entries.items():
+        assert key_board == board
+        state = start
+        for action in plan:
+            state = model.transition(state, action)
+        assert state[0] == goal
+        if optimal:
+            assert len(plan) == len(BFSAgent(model, max_nodes=1_000_000)._bfs_plan(start))
+
+
+def test_wall_on_plan_drops_entry(make_puzzle):
+    model, start, plan = solved_model(make_puzzle, seed=1)
+    robot, direction = plan[0]
+    r, c = start[robot]
+
+    changed = model.add_wall(r, c, direction)
+
+    assert ((r, c), direction) in {(cell, d) for cell, d, _, _ in changed}
+    assert model.cache.lookup(model, start) is None
+    check_entries(model)
+
+
+def test_wall_edit_clears_optimal_flag(make_puzzle):
+    model, start, plan = solved_model(make_puzzle, seed=2)
+    before = len(model.cache)
+
+    # A wall well away from the plan: its entries survive, but a new wall may
+    # open a shorter route, so none of them is optimal any more
+    path = set()
+    state = start
+    for robot, direction in plan:
+        path.add(state[robot])
+        state = model.transition(state, (robot, direction))
+    for c in range(model.cols):
+        if not any(cell[1] == c for cell in path) and model.add_wall(8, c, UP):
+            break
+    else:
+        raise AssertionError("no free column for the wall")
+
+    assert len(model.cache) == before
+    assert all(not optimal for _, optimal in model.cache.entries.values())
+    check_entries(model)
+
+
+def test_edge_wall_keeps_optimal_entries(make_puzzle):
+    # A wall along the board edge changes the digest but moves no stop
+    model, start, plan = solved_model(make_puzzle, seed=3)
+    old_board = model.board_key()
+    if model.walls[0][5] & WALL_BITS[UP]:
+        changed = model.remove_wall(0, 5, UP)
+    else:
+        changed = model.add_wall(0, 5, UP)
+
+    assert changed == []
+    assert model.board_key() != old_board
+    assert model.cache.lookup(model, start) == (plan, True)
+    check_entries(model)
+
+
+def test_wall_round_trip(make_puzzle):
+    model, start, plan = solved_model(make_puzzle, seed=4)
+    robot, direction = plan[-1]
+    state = start
+    for action in plan[:-1]:
+        state = model.transition(state, action)
+    r, c = state[robot]
+
+    model.add_wall(r, c, direction)
+    check_entries(model)
+    model.remove_wall(r, c, direction)
+    check_entries(model)
+
+    replanned = BFSAgent(model, max_nodes=1_000_000)._cached_plan(start)
+    assert len(replanned) == len(plan)
+
+
+
+def test_successor_cache_derives_child_tables(make_puzzle):
+    model, start = make_puzzle(3, seed=6)
+    cache = SuccessorCache()
+    successors, table = cache.lookup(model, start)
+
+    for next_state, action in successors:
+        child, child_table = cache.lookup(model, next_state, start, table, action)
+        assert list(child) == list(model.successors(next_state))
+        assert list(child_table) == model.move_table(next_state)
+
+
+def test_successor_cache_follows_wall_edits(make_puzzle):
+    model, start = make_puzzle(3, seed=5)
+    cache = SuccessorCache()
+    successors, _ = cache.lookup(model, start)
+    assert list(successors) == list(model.successors(start))
+
+    robot, direction = next(model.successors(start))[1]
+    r, c = start[robot]
+    model.add_wall(r, c, direction)
+
+    successors, _ = cache.lookup(model, start)
+    assert list(successors) == list(model.successors(start))
+    assert len(cache) == 1
@@ -0,0 +1,31 @@
+"""
+RRModel move tables: derived tables must match ones built from scratch.
+"""
+
+import random
+
+import pytest
+
+
+def scrambled_states(model, start, count, seed):
+    """States reached by random walks of up to 30 moves from start."""
+    rng = random.Random(seed)
+    states = []
+    for _ in range(count):
+        state = start
+        for _ in range(rng.randrange(30)):
+            state = rng.choice(list(model.successors(state)))[0]
+        states.append(state)
+    return states
+
+
+@pytest.mark.parametrize("robots", [2, 3, 4])
+def test_child_move_table_matches_move_table(make_puzzle, robots):
+    model, start = make_puzzle(robots, seed=robots)
+    for state in scrambled_states(model, start, 100, seed=robots):
+        table = model.move_table(state)
+        assert list(model.successors_from_table(state, table)) == list(model.successors(state))
+
+        for next_state, action in model.successors(state):
+            derived = model.child_move_table(state, table, action, next_state)
+            assert derived == model.move_table(next_state)
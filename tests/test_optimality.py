@@ -0,0 +1,116 @@
+"""
+Every agent or search mode that claims optimal plans must match plain BFS.
+"""
+
+import pytest
+
+from agent.astar import WeightedAStarAgent
+from agent.backward import solve_many
+from agent.bfs import BFSAgent
+from agent.external_bfs import external_bfs_plan
+from agent.iddfs import IDDFSAgent
+from agent.parallel_bfs import ParallelBFSAgent
+
+SEEDS = [1, 2, 3, 4]
+
+
+def reaches_goal(model, start, plan):
+    state = start
+    for action in plan:
+        state = model.transition(state, action)
+    return model.is_terminal(state)
+
+
+def bfs_length(model, start):
+    plan = BFSAgent(model, max_nodes=1_000_000)._cached_plan(start)
+    assert plan is not None
+    return len(plan)
+
+
+def test_bitset_bfs_matches_set(make_puzzle):
+    model, start = make_puzzle(3, seed=5)
+    plan = BFSAgent(model, max_nodes=1_000_000, storage="bitset")._cached_plan(start)
+
+    assert len(plan) == bfs_length(model, start)
+    assert reaches_goal(model, start, plan)
+
+
+def test_parallel_bfs_matches_bfs(make_puzzle):
+    model, start = make_puzzle(3, seed=8)
+    plan = ParallelBFSAgent(model, workers=2)._cached_plan(start)
+
+    assert len(plan) == bfs_length(model, start)
+    assert reaches_goal(model, start, plan)
+
+
+def test_external_bfs_matches_bfs(make_puzzle, tmp_path):
+    # A tiny buffer forces several sorted runs per level
+    model, start = make_puzzle(3, seed=6)
+    plan, stats = external_bfs_plan(model, start, str(tmp_path), buffer_size=64)
+
+    assert len(plan) == bfs_length(model, start)
+    assert reaches_goal(model, start, plan)
+
+    agent = BFSAgent(model, max_nodes=1_000_000, storage="external", scratch_dir=str(tmp_path))
+    assert len(agent._cached_plan(start)) == len(plan)
+
+
+def test_external_bfs_terminates_when_unreachable(make_puzzle, tmp_path):
+    # The centre block is walled in, so the search must run out of new states
+    model, start = make_puzzle(2, seed=6)
+    model.goal = (7, 7)
+    plan, stats = external_bfs_plan(model, start, str(tmp_path))
+
+    assert plan is None
+    assert stats["levels"] < 100
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_optimal_astar_matches_bfs(make_puzzle, seed):
+    model, start = make_puzzle(3, seed)
+    plan = WeightedAStarAgent(model, weight=1.0, max_nodes=1_000_000)._astar_plan(start)
+
+    assert len(plan) == bfs_length(model, start)
+    assert reaches_goal(model, start, plan)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_backward_search_matches_bfs(make_puzzle, seed):
+    model, start = make_puzzle(3, seed)
+    [plan] = solve_many(model, [start])
+
+    assert len(plan) == bfs_length(model, start)
+    assert reaches_goal(model, start, plan)
+
+
+def test_solve_many_matches_bfs(make_puzzle):
+    model, start = make_puzzle(3, seed=9)
+    starts = [start]
+    for next_state, _ in model.successors(start):
+        if not model.is_terminal(next_state):
+            starts.append(next_state)
+
+    # A small backward budget also sends some starts through the forward search
+    stats = {}
+    plans = solve_many(model, starts, max_nodes=500, stats=stats)
+
+    assert stats["forward_searches"] > 0
+    for state, plan in zip(starts, plans):
+        assert len(plan) == bfs_length(model, state)
+        assert reaches_goal(model, state, plan)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_pruning_keeps_plans_optimal(make_puzzle, seed):
+    model, start = make_puzzle(3, seed)
+    length = bfs_length(model, start)
+
+    bfs = BFSAgent(model, max_nodes=1_000_000, prune=True)._cached_plan(start)
+    bitset = BFSAgent(model, max_nodes=1_000_000, storage="bitset", prune=True)._cached_plan(start)
+    iddfs = IDDFSAgent(model, max_depth=length, max_nodes=10_000_000, prune=True)
+    plan = iddfs._cached_plan(start)
+
+    assert len(bfs) == length
+    assert len(bitset) == length
+    assert len(plan) == length
+    assert iddfs.plan_optimal
@@ -0,0 +1,28 @@
+from agent.registry import make_agent
+from utils.profiling import AgentProfiler
+
+
+def test_mcts_reports_allocation_sites(tmp_path, make_puzzle):
+    # MCTS reaches its successors through a SuccessorCache, never model.successors
+    model, start = make_puzzle(3, seed=7)
+    agent = make_agent("mcts", model, time=0.5, rollout_depth=100)
+    profiler = AgentProfiler(str(tmp_path))
+
+    with profiler.run("MCTS") as result:
+        agent.choose_action(start)
+
+    assert result["peak_bytes"] > 0
+    assert profiler.sites["MCTS"]
+
+
+def test_bfs_reports_allocation_sites(tmp_path, make_puzzle):
+    # Big enough (about 3 MB) to pass the tracker's MIN_SNAPSHOT_BYTES
+    model, start = make_puzzle(4, seed=3)
+    agent = make_agent("bfs", model, max_nodes=200_000)
+    profiler = AgentProfiler(str(tmp_path))
+
+    with profiler.run("BFS"):
+        agent.solve(start)
+
+    assert profiler.sites["BFS"]
+    assert profiler.save() == [str(tmp_path / "BFS.prof")]
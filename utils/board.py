@@ -0,0 +1,209 @@
+"""
+The standard Ricochet Robots board layout and a cached board builder.
+
+generate_rr_board() serves boards from utils/board_data.py, a precomputed
+artifact that Python loads from its bytecode cache, so entry points and pool
+workers skip the wall construction. Sizes missing from the artifact, or an
+artifact built from a different layout, fall back to build_rr_board().
+Regenerate the artifact after changing the layout:
+
+    python -m utils.board
+"""
+
+import functools
+import os
+import zlib
+
+from model.model import W_LEFT, W_RIGHT, W_UP, W_DOWN
+
+# Layout of one 16x16 quadrant set; larger boards tile it
+BASE_SIZE = 16
+
+CLUSTERS = [
+    (1, 4, "LEFT", "UP"),
+    (1, 14, "LEFT", "UP"),
+    (2, 1, "RIGHT", "UP"),
+    (2, 11, "LEFT", "DOWN"),
+    (3, 6, "DOWN", "RIGHT"),
+    (6, 3, "LEFT", "DOWN"),
+    (6, 13, "RIGHT", "DOWN"),
+    (8, 5, "UP", "RIGHT"),
+    (9, 1, "RIGHT", "DOWN"),
+    (9, 13, "LEFT", "DOWN"),
+    (11, 9, "RIGHT", "DOWN"),
+    (14, 3, "LEFT", "UP"),
+    (14, 10, "LEFT", "UP"),
+    (13, 5, "RIGHT", "UP"),
+    (13, 14, "RIGHT", "UP"),
+]
+
+# Center block, relative to the top-left of the board's middle 2x2
+CENTER_BLOCK = [
+    (0, 0, "UP", "LEFT"),
+    (0, 1, "UP", "RIGHT"),
+    (1, 0, "DOWN", "LEFT"),
+    (1, 1, "RIGHT", "DOWN"),
+]
+
+SINGLE_WALLS = [
+    (0, 1, "RIGHT"),
+    (0, 9, "RIGHT"),
+    (5, 0, "DOWN"),
+    (11, 0, "DOWN"),
+    (15, 6, "RIGHT"),
+    (15, 11, "RIGHT"),
+    (3, 15, "DOWN"),
+    (11, 15, "DOWN"),
+    (6, 10, "DOWN"),
+]
+
+TARGETS = [
+    (1, 4),
+    (1, 14),
+    (2, 1),
+    (2, 11),
+    (3, 6),
+    (6, 3),
+    (6, 13),
+    (8, 5),
+    (9, 1),
+    (9, 13),
+    (11, 9),
+    (14, 3),
+    (14, 10),
+    (13, 5),
+    (13, 14),
+]
+
+# Sizes written to the artifact: the harness default and the scaling bench's
+PRECOMPUTED_SIZES = (16, 32, 64)
+
+ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "board_data.py")
+
+
+def layout_checksum():
+    """Fingerprint of the layout constants; the artifact is ignored when it differs."""
+    layout = (BASE_SIZE, CLUSTERS, CENTER_BLOCK, SINGLE_WALLS, TARGETS)
+    return zlib.crc32(repr(layout).encode())
+
+
+def generate_rr_board(rows=16, cols=16):
+    """
+    Ricochet-Robots-style board, from the artifact when possible.
+    Returns (walls, targets); the lists are fresh, so callers may edit them.
+    """
+    walls, targets = _cached_board(rows, cols)
+    return [list(row) for row in walls], list(targets)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_board(rows, cols):
+    board = _artifact().get((rows, cols))
+    if board is None:
+        walls, targets = build_rr_board(rows, cols)
+        board = tuple(tuple(row) for row in walls), tuple(targets)
+    return board
+
+
+@functools.lru_cache(maxsize=1)
+def _artifact():
+    try:
+        from utils import board_data
+    except ImportError:
+        return {}
+    if board_data.LAYOUT != layout_checksum():
+        return {}
+    return board_data.BOARDS
+
+
+def build_rr_board(rows=16, cols=16):
+    """
+    Generate a Ricochet-Robots-style board:
+    - perimeter walls
+    - internal wall clusters (the 16x16 layout, tiled across larger boards)
+    - center block
+    Returns (walls, targets)
+    """
+
+    walls = [[0 for _ in range(cols)] for _ in range(rows)]
+
+    for r in range(rows):
+        walls[r][0] |= W_LEFT
+        walls[r][cols-1] |= W_RIGHT
+
+    for c in range(cols):
+        walls[0][c] |= W_UP
+        walls[rows-1][c] |= W_DOWN
+
+    def add_wall(r, c, direction):
+        if not (0 <= r < rows and 0 <= c < cols):
+            return
+        if direction == "UP":
+            walls[r][c] |= W_UP
+            if r > 0:
+                walls[r-1][c] |= W_DOWN
+        elif direction == "DOWN":
+            walls[r][c] |= W_DOWN
+            if r < rows - 1:
+                walls[r+1][c] |= W_UP
+        elif direction == "LEFT":
+            walls[r][c] |= W_LEFT
+            if c > 0:
+                walls[r][c-1] |= W_RIGHT
+        elif direction == "RIGHT":
+            walls[r][c] |= W_RIGHT
+            if c < cols - 1:
+                walls[r][c+1] |= W_LEFT
+
+    targets = []
+    for tr in range(0, rows, BASE_SIZE):
+        for tc in range(0, cols, BASE_SIZE):
+            for r, c, d1, d2 in CLUSTERS:
+                add_wall(tr + r, tc + c, d1)
+                add_wall(tr + r, tc + c, d2)
+
+            for r, c, d in SINGLE_WALLS:
+                add_wall(tr + r, tc + c, d)
+
+            for r, c in TARGETS:
+                if tr + r < rows and tc + c < cols:
+                    targets.append((tr + r, tc + c))
+
+    cr, cc = rows // 2 - 1, cols // 2 - 1
+    for r, c, d1, d2 in CENTER_BLOCK:
+        add_wall(cr + r, cc + c, d1)
+        add_wall(cr + r, cc + c, d2)
+
+    return walls, targets
+
+
+def write_artifact(path=ARTIFACT_PATH, sizes=PRECOMPUTED_SIZES):
+    """Write the precomputed boards as a Python module of literal tuples."""
+    lines = [
+        '"""Precomputed boards. Generated by `python -m utils.board`; do not edit."""',
+        "",
+        f"LAYOUT = {layout_checksum()}",
+        "",
+        "BOARDS = {",
+    ]
+    for size in sizes:
+        walls, targets = build_rr_board(size, size)
+        lines.append(f"    ({size}, {size}): (")
+        lines.append("        (")
+        for row in walls:
+            lines.append(f"            {tuple(row)!r},")
+        lines.append("        ),")
+        lines.append("        (")
+        for i in range(0, len(targets), 8):
+            lines.append("            " + " ".join(f"{t!r}," for t in targets[i:i + 8]))
+        lines.append("        ),")
+        lines.append("    ),")
+    lines.append("}")
+
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    write_artifact()
+    print(f"Wrote {', '.join(f'{s}x{s}' for s in PRECOMPUTED_SIZES)} boards to {ARTIFACT_PATH}")
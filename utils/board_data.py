@@ -0,0 +1,176 @@
+"""Precomputed boards. Generated by `python -m utils.board`; do not edit."""
+
+LAYOUT = 330771871
+
+BOARDS = {
+    (16, 16): (
+        (
+            (9, 3, 9, 1, 5, 1, 1, 1, 1, 3, 9, 1, 1, 1, 5, 3),
+            (8, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 2),
+            (8, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 6),
+            (8, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 3),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (9, 0, 2, 12, 0, 0, 0, 4, 4, 0, 4, 0, 0, 6, 8, 2),
+            (8, 0, 0, 1, 0, 4, 2, 9, 3, 8, 1, 0, 0, 1, 0, 2),
+            (8, 0, 0, 0, 0, 3, 10, 12, 6, 8, 0, 0, 0, 0, 0, 2),
+            (8, 6, 8, 0, 0, 0, 0, 1, 1, 0, 0, 0, 2, 12, 0, 2),
+            (8, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 2),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 6),
+            (9, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 3),
+            (8, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 10),
+            (8, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 2),
+            (12, 4, 4, 4, 4, 4, 6, 12, 4, 4, 4, 6, 12, 4, 4, 6),
+        ),
+        (
+            (1, 4), (1, 14), (2, 1), (2, 11), (3, 6), (6, 3), (6, 13), (8, 5),
+            (9, 1), (9, 13), (11, 9), (14, 3), (14, 10), (13, 5), (13, 14),
+        ),
+    ),
+    (32, 32): (
+        (
+            (9, 3, 9, 1, 5, 1, 1, 1, 1, 3, 9, 1, 1, 1, 5, 1, 1, 3, 9, 1, 5, 1, 1, 1, 1, 3, 9, 1, 1, 1, 5, 3),
+            (8, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 2),
+            (8, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 6),
+            (8, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 3),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (9, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 2),
+            (8, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 2),
+            (8, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (8, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 2),
+            (8, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 2),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 6),
+            (9, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 3),
+            (8, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 10),
+            (8, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 4, 4, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 2, 9, 3, 8, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 2),
+            (8, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 6, 12, 6, 10, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 2),
+            (8, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 1, 1, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 2),
+            (8, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 6),
+            (8, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 3),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (9, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 2),
+            (8, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 2),
+            (8, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (8, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 2),
+            (8, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 2),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 6),
+            (9, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 3),
+            (8, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 10),
+            (8, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 2),
+            (12, 4, 4, 4, 4, 4, 6, 12, 4, 4, 4, 6, 12, 4, 4, 4, 4, 4, 4, 4, 4, 4, 6, 12, 4, 4, 4, 6, 12, 4, 4, 6),
+        ),
+        (
+            (1, 4), (1, 14), (2, 1), (2, 11), (3, 6), (6, 3), (6, 13), (8, 5),
+            (9, 1), (9, 13), (11, 9), (14, 3), (14, 10), (13, 5), (13, 14), (1, 20),
+            (1, 30), (2, 17), (2, 27), (3, 22), (6, 19), (6, 29), (8, 21), (9, 17),
+            (9, 29), (11, 25), (14, 19), (14, 26), (13, 21), (13, 30), (17, 4), (17, 14),
+            (18, 1), (18, 11), (19, 6), (22, 3), (22, 13), (24, 5), (25, 1), (25, 13),
+            (27, 9), (30, 3), (30, 10), (29, 5), (29, 14), (17, 20), (17, 30), (18, 17),
+            (18, 27), (19, 22), (22, 19), (22, 29), (24, 21), (25, 17), (25, 29), (27, 25),
+            (30, 19), (30, 26), (29, 21), (29, 30),
+        ),
+    ),
+    (64, 64): (
+        (
+            (9, 3, 9, 1, 5, 1, 1, 1, 1, 3, 9, 1, 1, 1, 5, 1, 1, 3, 9, 1, 5, 1, 1, 1, 1, 3, 9, 1, 1, 1, 5, 1, 1, 3, 9, 1, 5, 1, 1, 1, 1, 3, 9, 1, 1, 1, 5, 1, 1, 3, 9, 1, 5, 1, 1, 1, 1, 3, 9, 1, 1, 1, 5, 3),
+            (8, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 2),
+            (8, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 6),
+            (8, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 3),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (9, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 2),
+            (8, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 2),
+            (8, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (8, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 2),
+            (8, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 2),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 6),
+            (9, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 3),
+            (8, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 10),
+            (8, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 2),
+            (8, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 0, 0, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 0, 0, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 0, 0, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 2),
+            (8, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 2),
+            (8, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 6),
+            (8, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 3),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (9, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 2),
+            (8, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 2),
+            (8, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (8, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 2),
+            (8, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 2),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 6),
+            (9, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 3),
+            (8, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 10),
+            (8, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 4, 4, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 2, 9, 3, 8, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 2),
+            (8, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 0, 0, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 6, 12, 6, 10, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 0, 0, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 2),
+            (8, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 1, 1, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 2),
+            (8, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 6),
+            (8, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 3),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (9, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 2),
+            (8, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 2),
+            (8, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (8, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 2),
+            (8, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 2),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 6),
+            (9, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 3),
+            (8, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 10),
+            (8, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 8, 0, 0, 0, 2, 8, 0, 0, 2),
+            (8, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 0, 0, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 0, 0, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 0, 0, 2, 8, 0, 4, 0, 0, 0, 0, 2, 8, 0, 0, 0, 4, 2),
+            (8, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 4, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 0, 2, 9, 2),
+            (8, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 2),
+            (8, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 1, 0, 0, 0, 6),
+            (8, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 3),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (9, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 0, 1, 0, 2, 12, 0, 0, 0, 0, 0, 0, 4, 0, 0, 6, 8, 2),
+            (8, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 4, 0, 0, 0, 0, 1, 0, 0, 1, 0, 2),
+            (8, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 8, 0, 0, 0, 0, 0, 0, 0, 0, 2),
+            (8, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 0, 0, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 12, 0, 2),
+            (8, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 2),
+            (12, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 4, 4, 0, 0, 0, 0, 0, 0, 0, 0, 6, 8, 0, 0, 0, 0, 6),
+            (9, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 1, 1, 0, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 0, 0, 4, 3),
+            (8, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 8, 0, 0, 0, 4, 0, 3, 8, 0, 0, 0, 4, 0, 0, 0, 3, 10),
+            (8, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 0, 2, 9, 0, 0, 0, 0, 2),
+            (12, 4, 4, 4, 4, 4, 6, 12, 4, 4, 4, 6, 12, 4, 4, 4, 4, 4, 4, 4, 4, 4, 6, 12, 4, 4, 4, 6, 12, 4, 4, 4, 4, 4, 4, 4, 4, 4, 6, 12, 4, 4, 4, 6, 12, 4, 4, 4, 4, 4, 4, 4, 4, 4, 6, 12, 4, 4, 4, 6, 12, 4, 4, 6),
+        ),
+        (
+            (1, 4), (1, 14), (2, 1), (2, 11), (3, 6), (6, 3), (6, 13), (8, 5),
+            (9, 1), (9, 13), (11, 9), (14, 3), (14, 10), (13, 5), (13, 14), (1, 20),
+            (1, 30), (2, 17), (2, 27), (3, 22), (6, 19), (6, 29), (8, 21), (9, 17),
+            (9, 29), (11, 25), (14, 19), (14, 26), (13, 21), (13, 30), (1, 36), (1, 46),
+            (2, 33), (2, 43), (3, 38), (6, 35), (6, 45), (8, 37), (9, 33), (9, 45),
+            (11, 41), (14, 35), (14, 42), (13, 37), (13, 46), (1, 52), (1, 62), (2, 49),
+            (2, 59), (3, 54), (6, 51), (6, 61), (8, 53), (9, 49), (9, 61), (11, 57),
+            (14, 51), (14, 58), (13, 53), (13, 62), (17, 4), (17, 14), (18, 1), (18, 11),
+            (19, 6), (22, 3), (22, 13), (24, 5), (25, 1), (25, 13), (27, 9), (30, 3),
+            (30, 10), (29, 5), (29, 14), (17, 20), (17, 30), (18, 17), (18, 27), (19, 22),
+            (22, 19), (22, 29), (24, 21), (25, 17), (25, 29), (27, 25), (30, 19), (30, 26),
+            (29, 21), (29, 30), (17, 36), (17, 46), (18, 33), (18, 43), (19, 38), (22, 35),
+            (22, 45), (24, 37), (25, 33), (25, 45), (27, 41), (30, 35), (30, 42), (29, 37),
+            (29, 46), (17, 52), (17, 62), (18, 49), (18, 59), (19, 54), (22, 51), (22, 61),
+            (24, 53), (25, 49), (25, 61), (27, 57), (30, 51), (30, 58), (29, 53), (29, 62),
+            (33, 4), (33, 14), (34, 1), (34, 11), (35, 6), (38, 3), (38, 13), (40, 5),
+            (41, 1), (41, 13), (43, 9), (46, 3), (46, 10), (45, 5), (45, 14), (33, 20),
+            (33, 30), (34, 17), (34, 27), (35, 22), (38, 19), (38, 29), (40, 21), (41, 17),
+            (41, 29), (43, 25), (46, 19), (46, 26), (45, 21), (45, 30), (33, 36), (33, 46),
+            (34, 33), (34, 43), (35, 38), (38, 35), (38, 45), (40, 37), (41, 33), (41, 45),
+            (43, 41), (46, 35), (46, 42), (45, 37), (45, 46), (33, 52), (33, 62), (34, 49),
+            (34, 59), (35, 54), (38, 51), (38, 61), (40, 53), (41, 49), (41, 61), (43, 57),
+            (46, 51), (46, 58), (45, 53), (45, 62), (49, 4), (49, 14), (50, 1), (50, 11),
+            (51, 6), (54, 3), (54, 13), (56, 5), (57, 1), (57, 13), (59, 9), (62, 3),
+            (62, 10), (61, 5), (61, 14), (49, 20), (49, 30), (50, 17), (50, 27), (51, 22),
+            (54, 19), (54, 29), (56, 21), (57, 17), (57, 29), (59, 25), (62, 19), (62, 26),
+            (61, 21), (61, 30), (49, 36), (49, 46), (50, 33), (50, 43), (51, 38), (54, 35),
+            (54, 45), (56, 37), (57, 33), (57, 45), (59, 41), (62, 35), (62, 42), (61, 37),
+            (61, 46), (49, 52), (49, 62), (50, 49), (50, 59), (51, 54), (54, 51), (54, 61),
+            (56, 53), (57, 49), (57, 61), (59, 57), (62, 51), (62, 58), (61, 53), (61, 62),
+        ),
+    ),
+}
@@ -0,0 +1,84 @@
+"""
+Background solver for manual_play hints and autoplay.
+
+A worker thread solves the current state and then each state one move
+ahead, while the player is still choosing, into a lock-protected
+SolutionCache. hint() only looks the state up, so it never blocks on search.
+"""
+
+import threading
+
+from agent.astar import WeightedAStarAgent
+from model.cache import SolutionCache
+from model.model import RRModel
+
+
+class HintWorker:
+    def __init__(self, model, max_nodes=200_000, cache_size=50_000):
+        """
+        model     : the game's model; the worker searches on its own copy
+        max_nodes : A* expansions per state before it is skipped
+        """
+        self.model = model
+        self.lock = threading.Lock()
+        self.cache = SolutionCache(cache_size)
+        self.solved = 0
+
+        # The search runs on a private model so the game's never changes
+        # under it; same walls, so the same board key in the cache
+        self._search_model = RRModel(model.rows, model.cols, model.walls, goal_pos=model.goal)
+        self._solver = WeightedAStarAgent(self._search_model, weight=1.0, max_nodes=max_nodes)
+        self._wake = threading.Condition()
+        self._pending = None
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="hint-worker", daemon=True)
+        self._thread.start()
+
+    def update(self, state):
+        """The player is now at state: solve it and the states one move ahead."""
+        with self._wake:
+            self._pending = state
+            self._wake.notify()
+
+    def hint(self, state):
+        """The cached optimal plan from state, or None if it is not solved yet."""
+        with self.lock:
+            hit = self.cache.lookup(self.model, state)
+        return None if hit is None else hit[0]
+
+    def stop(self):
+        with self._wake:
+            self._stopped = True
+            self._wake.notify()
+        self._thread.join()
+
+    def _should_stop(self):
+        # Quitting, or the player moved on and the search is for a stale state
+        return self._stopped or self._pending is not None
+
+    def _run(self):
+        while True:
+            with self._wake:
+                while self._pending is None and not self._stopped:
+                    self._wake.wait()
+                if self._stopped:
+                    return
+                state, self._pending = self._pending, None
+
+            ahead = [state] + [s for s, _ in self._search_model.successors(state)]
+            for target in ahead:
+                if self._pending is not None or self._stopped:
+                    # The player moved on; start again from the new state
+                    break
+                if self._search_model.is_terminal(target):
+                    continue
+                with self.lock:
+                    if self.cache.contains(self._search_model, target):
+                        continue
+                # Checked inside the search too, so neither stop() nor the
+                # player's next state waits out a whole max_nodes search
+                plan = self._solver._astar_plan(target, should_stop=self._should_stop)
+                if plan is not None:
+                    with self.lock:
+                        self.cache.store(self._search_model, target, plan, optimal=True)
+                    self.solved += 1
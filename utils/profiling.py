@@ -0,0 +1,156 @@
+"""
+cProfile + tracemalloc instrumentation for the test harness (test.py --profile DIR).
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+# Seconds between memory checks
+SAMPLE_INTERVAL = 0.002
+# Take a new allocation snapshot once traced memory grows by this factor
+SNAPSHOT_GROWTH = 1.25
+MIN_SNAPSHOT_BYTES = 1 << 20
+
+_IGNORED = {tracemalloc.__file__, threading.__file__, __file__}
+
+
+class PeakTracker:
+    def __init__(self, top=5, interval=SAMPLE_INTERVAL):
+        """
+        Track peak traced memory while an agent runs, and the largest allocation
+        sites near that peak.
+
+        Search structures (BFS visited/queue, MCTS trees) are freed when
+        choose_action() returns, so a snapshot afterwards would miss them.
+        Instead a sampler thread checks traced memory every `interval` seconds
+        during the search and snapshots whenever it reaches a new high. That
+        covers every agent, whatever path it takes to its successors. cProfile
+        only hooks the thread that enabled it, so snapshots never show up as hot.
+        """
+        self.top = top
+        self.interval = interval
+        self.sites = []
+        self.peak = 0
+        self.enabled = _start_tracing()
+        self._snapshot_at = MIN_SNAPSHOT_BYTES
+        self._done = threading.Event()
+        self._thread = None
+
+        if self.enabled:
+            tracemalloc.reset_peak()
+            self._thread = threading.Thread(target=self._run, name="peak-tracker", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._done.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        current = tracemalloc.get_traced_memory()[0]
+        if current >= self._snapshot_at:
+            self._snapshot_at = current * SNAPSHOT_GROWTH
+            # Group first, then drop our own frames: filter_traces() on every
+            # trace is far slower than filtering the grouped statistics
+            sites = []
+            for stat in tracemalloc.take_snapshot().statistics("lineno"):
+                frame = stat.traceback[0]
+                if frame.filename in _IGNORED:
+                    continue
+                sites.append((f"{frame.filename}:{frame.lineno}", stat.size))
+                if len(sites) == self.top:
+                    break
+            self.sites = sites
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self._done.set()
+        self._thread.join()
+        self.peak = tracemalloc.get_traced_memory()[1]
+
+
+def _start_tracing():
+    if not tracemalloc.is_tracing():
+        try:
+            tracemalloc.start()
+        except (RuntimeError, NotImplementedError):
+            return False
+    return tracemalloc.is_tracing()
+
+
+class AgentProfiler:
+    def __init__(self, out_dir, top=8, memory=True):
+        """
+        out_dir : directory for per-agent cProfile stats files (<agent>.prof)
+        top     : hot functions / allocation sites shown per agent
+        memory  : also track peak memory with tracemalloc (slows agents down)
+        """
+        self.out_dir = out_dir
+        self.top = top
+        self.memory = memory
+        self.profiles = {}
+        self.peaks = {}
+        self.sites = {}
+        os.makedirs(out_dir, exist_ok=True)
+
+    @contextmanager
+    def run(self, name):
+        """Profile one agent run; stats accumulate per agent name."""
+        prof = self.profiles.setdefault(name, cProfile.Profile())
+        tracker = PeakTracker(self.top) if self.memory else None
+        result = {}
+
+        prof.enable()
+        try:
+            yield result
+        finally:
+            prof.disable()
+            if tracker is not None:
+                tracker.stop()
+                result["peak_bytes"] = tracker.peak
+                if tracker.peak >= self.peaks.get(name, 0):
+                    self.peaks[name] = tracker.peak
+                    self.sites[name] = tracker.sites
+
+    def save(self):
+        paths = []
+        for name, prof in self.profiles.items():
+            path = os.path.join(self.out_dir, f"{name}.prof")
+            prof.dump_stats(path)
+            paths.append(path)
+        return paths
+
+    def hot_functions(self, name):
+        """[(function, calls, tottime, cumtime)] sorted by own time."""
+        stats = pstats.Stats(self.profiles[name], stream=io.StringIO())
+        rows = []
+        for (filename, lineno, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            where = f"{os.path.relpath(filename)}:{lineno}" if lineno else filename
+            rows.append((f"{func} ({where})", ncalls, tottime, cumtime))
+        rows.sort(key=lambda r: -r[2])
+        return rows[:self.top]
+
+    def print_summary(self):
+        print("\n" + "=" * 80)
+        print("PROFILE")
+        print("=" * 80)
+
+        for name in self.profiles:
+            peak = self.peaks.get(name)
+            peak_str = f"{peak / 2**20:.1f} MB" if peak is not None else "n/a"
+            print(f"\n--- {name} (peak traced memory {peak_str}) ---")
+            print(f"{'Own (s)':<10} {'Cum (s)':<10} {'Calls':<12} {'Function'}")
+            for func, calls, tottime, cumtime in self.hot_functions(name):
+                print(f"{tottime:<10.3f} {cumtime:<10.3f} {calls:<12} {func}")
+
+            if self.sites.get(name):
+                print("Largest allocation sites near peak:")
+                for site, size in self.sites[name]:
+                    print(f"  {size / 2**20:>8.2f} MB  {os.path.relpath(site)}")
+
+        print(f"\nStats files written to {self.out_dir}/ (open with python -m pstats)")
@@ -5,6 +5,7 @@ from model.model import UP, RIGHT, DOWN, LEFT
 def place_blockers_near_goal(model, goal, count):
     """
     Place `count` blocker robots near the goal, without overlap.
+    Fills the 8 neighbours first, then successive rings around the goal.
     """
     gr, gc = goal
 
@@ -20,11 +21,21 @@ def place_blockers_near_goal(model, goal, count):
     ]
 
     blockers = []
-    for r, c in candidates:
-        if len(blockers) == count:
-            break
-        if 0 <= r < model.rows and 0 <= c < model.cols:
-            blockers.append((r, c))
+    ring = 1
+    while len(blockers) < count and ring <= max(model.rows, model.cols):
+        for r, c in candidates:
+            if len(blockers) == count:
+                break
+            if 0 <= r < model.rows and 0 <= c < model.cols:
+                blockers.append((r, c))
+
+        ring += 1
+        candidates = [
+            (gr + dr, gc + dc)
+            for dr in range(-ring, ring + 1)
+            for dc in range(-ring, ring + 1)
+            if max(abs(dr), abs(dc)) == ring
+        ]
 
     if len(blockers) < count:
         raise RuntimeError("Could not place enough blocker robots")
@@ -36,31 +47,21 @@ def place_blockers_near_goal(model, goal, count):
 # Solved states
 # ============================================================
 
+def make_solved_state(model, goal, num_robots):
+    blockers = place_blockers_near_goal(model, goal, count=num_robots - 1)
+    return (goal,) + tuple(blockers)   # target robot first
+
+
 def make_solved_state_2robots(model, goal):
-    blockers = place_blockers_near_goal(model, goal, count=1)
-    return (
-        goal,          # target robot
-        blockers[0],   # blocker
-    )
+    return make_solved_state(model, goal, 2)
 
 
 def make_solved_state_3robots(model, goal):
-    blockers = place_blockers_near_goal(model, goal, count=2)
-    return (
-        goal,          # target robot
-        blockers[0],
-        blockers[1],
-    )
+    return make_solved_state(model, goal, 3)
 
 
 def make_solved_state_4robots(model, goal):
-    blockers = place_blockers_near_goal(model, goal, count=3)
-    return (
-        goal,          # target robot
-        blockers[0],
-        blockers[1],
-        blockers[2],
-    )
+    return make_solved_state(model, goal, 4)
 
 
 # ============================================================
@@ -93,31 +94,23 @@ def scramble_state(model, state, steps=40):
 
     return current
 
-def generate_solvable_puzzle_2robots(model, targets, scramble_steps=40):
+def generate_solvable_puzzle(model, targets, num_robots, scramble_steps=40):
     goal = random.choice(targets)
     model.goal = goal
 
-    solved_state = make_solved_state_2robots(model, goal)
+    solved_state = make_solved_state(model, goal, num_robots)
     start_state = scramble_state(model, solved_state, scramble_steps)
 
     return start_state, goal
 
 
-def generate_solvable_puzzle_3robots(model, targets, scramble_steps=40):
-    goal = random.choice(targets)
-    model.goal = goal
+def generate_solvable_puzzle_2robots(model, targets, scramble_steps=40):
+    return generate_solvable_puzzle(model, targets, 2, scramble_steps)
 
-    solved_state = make_solved_state_3robots(model, goal)
-    start_state = scramble_state(model, solved_state, scramble_steps)
 
-    return start_state, goal
+def generate_solvable_puzzle_3robots(model, targets, scramble_steps=40):
+    return generate_solvable_puzzle(model, targets, 3, scramble_steps)
 
 
 def generate_solvable_puzzle_4robots(model, targets, scramble_steps=40):
-    goal = random.choice(targets)
-    model.goal = goal
-
-    solved_state = make_solved_state_4robots(model, goal)
-    start_state = scramble_state(model, solved_state, scramble_steps)
-
-    return start_state, goal
+    return generate_solvable_puzzle(model, targets, 4, scramble_steps)
@@ -0,0 +1,149 @@
+"""
+Streaming JSONL trial results.
+
+Every agent run in a benchmark campaign becomes one JSON line, appended as
+soon as it finishes:
+
+    {"trial": 3, "seed": 3002, "base_seed": 0, "robots": 2, "board_size": 16,
+     "start": [[r, c], ...], "goal": [r, c], "agent": "BFS", "success": true,
+     "moves": 9, "time": 0.02, "counters": {...}}
+
+Aggregate a results file without re-running anything:
+
+    python -m utils.results results.jsonl
+"""
+
+import argparse
+import json
+import os
+
+
+def trial_seed(base_seed, trial, robots):
+    """Per-(trial, robot count) seed, so a resumed run regenerates the same puzzles."""
+    return base_seed * 1_000_000 + trial * 1_000 + robots
+
+
+def iter_results(path):
+    """Yield records from a JSONL file one line at a time, skipping a torn last line."""
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write leaves at most one partial line behind
+                continue
+
+
+class ResultLog:
+    def __init__(self, path, resume=False, base_seed=None):
+        """
+        path      : JSONL file to append to
+        resume    : report existing records of this campaign via recorded()
+        base_seed : seed for this campaign; on resume defaults to the file's.
+                    Records are always appended, tagged with the base seed.
+        """
+        self.path = path
+        self.records = {}
+
+        if resume and os.path.exists(path):
+            for rec in iter_results(path):
+                if base_seed is None:
+                    base_seed = rec.get("base_seed")
+                if rec.get("base_seed") == base_seed:
+                    self.records[(rec["trial"], rec["robots"], rec["agent"])] = rec
+
+        self.base_seed = base_seed if base_seed is not None else int.from_bytes(os.urandom(3), "big")
+        self.file = open(path, "a")
+
+    def recorded(self, trial, robots, agent):
+        return self.records.get((trial, robots, agent))
+
+    def write(self, record):
+        record = dict(record, base_seed=self.base_seed)
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.records[(record["trial"], record["robots"], record["agent"])] = record
+
+    def close(self):
+        self.file.close()
+
+
+def aggregate(records):
+    """
+    Fold records into {robots: {agent: {"runs", "success", "moves", "time"}}},
+    the shape print_aggregate_results() expects.
+    """
+    stats = {}
+    for rec in records:
+        data = stats.setdefault(rec["robots"], {}).setdefault(
+            rec["agent"], {"runs": 0, "success": 0, "moves": [], "time": []})
+        data["runs"] += 1
+        if rec["success"]:
+            data["success"] += 1
+            data["moves"].append(rec["moves"])
+            data["time"].append(rec["time"])
+    return stats
+
+
+def print_aggregate_results(stats, robot_counts=None):
+    print("\n" + "=" * 80)
+    print("AGGREGATE RESULTS")
+    print("=" * 80)
+
+    for rc in robot_counts or sorted(stats):
+        print(f"\n--- {rc} ROBOTS ---")
+        print(f"{'Agent':<10} {'Success %':<10} {'Avg Moves':<12} {'Avg Time (s)'}")
+        print("-" * 60)
+
+        for agent, data in stats.get(rc, {}).items():
+            if data["moves"]:
+                success_rate = 100 * data["success"] / data["runs"]
+                avg_moves = sum(data["moves"]) / len(data["moves"])
+                avg_time = sum(data["time"]) / len(data["time"])
+                print(f"{agent:<10} {success_rate:<10.0f} {avg_moves:<12.1f} {avg_time:<.3f}")
+            else:
+                print(f"{agent:<10} 0%         N/A          N/A")
+
+
+def print_portfolio_summary(races):
+    from agent.portfolio import summarize_history
+
+    races = [dict(r, **{"class": tuple(r["class"])}) for r in races]
+
+    print("\n" + "=" * 80)
+    print("PORTFOLIO WINNERS")
+    print("=" * 80)
+    print(f"{'Board':<8} {'Robots':<8} {'Member':<10} {'Wins':<8} {'Avg Race Time (s)'}")
+    print("-" * 60)
+
+    for (size, robots), members in sorted(summarize_history(races).items()):
+        for member, row in sorted(members.items(), key=lambda kv: -kv[1]["wins"]):
+            print(f"{f'{size}x{size}':<8} {robots:<8} {member:<10} {row['wins']:<8} {row['avg_time']:.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate a JSONL results file")
+    parser.add_argument("path")
+    parser.add_argument("--base-seed", type=int, help="only records from this campaign")
+    args = parser.parse_args(argv)
+
+    races = []
+
+    def records():
+        for rec in iter_results(args.path):
+            if args.base_seed is not None and rec.get("base_seed") != args.base_seed:
+                continue
+            races.extend((rec.get("counters") or {}).get("portfolio", []))
+            yield rec
+
+    print_aggregate_results(aggregate(records()))
+    if races:
+        print_portfolio_summary(races)
+
+
+if __name__ == "__main__":
+    main()